@@ -1,48 +1,74 @@
-import logging, asyncio, inspect
-from typing import Callable, Dict, List, Any, Awaitable, Union
+import logging, asyncio, sys
+from typing import Callable, Dict, List, Any, Awaitable, Tuple, Union
 
 class Events:
     """
     Defines event types for the EventBus.
+
+    The constants are interned so every subscriber and publisher going through
+    Events.* shares one string object, letting the dispatch dict compare keys
+    by identity before falling back to a character compare.
     """
-    ORDER_FILLED = "order_filled"
-    ORDER_CANCELLED = "order_cancelled"
-    START_BOT = "start_bot"
-    STOP_BOT = "stop_bot"
+    ORDER_FILLED = sys.intern("order_filled")
+    ORDERS_FILLED_BATCH = sys.intern("orders_filled_batch")
+    ORDER_CANCELLED = sys.intern("order_cancelled")
+    START_BOT = sys.intern("start_bot")
+    STOP_BOT = sys.intern("stop_bot")
 
 class EventBus:
     """
     A simple event bus for managing pub-sub interactions with support for both sync and async publishing.
     """
 
+    ASYNC_CALLBACK = 0
+    SYNC_CALLBACK = 1
+    BLOCKING_SYNC_CALLBACK = 2
+
     def __init__(self):
         """
         Initializes the EventBus with an empty subscriber list.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.subscribers: Dict[str, List[Callable[[Any], None]]] = {}
+        self.subscribers: Dict[str, List[Tuple[int, Callable[[Any], None]]]] = {}
         self._tasks: set[asyncio.Task] = set()
 
     def subscribe(
-        self, 
-        event_type: str, 
-        callback: Union[Callable[[Any], None], Callable[[Any], Awaitable[None]]]
+        self,
+        event_type: str,
+        callback: Union[Callable[[Any], None], Callable[[Any], Awaitable[None]]],
+        blocking: bool = False
     ) -> None:
         """
         Subscribes a callback to a specific event type.
 
+        The callback is classified once (async vs sync) at subscription time so
+        `publish` can dispatch without introspecting the callback on every event.
+
         Args:
             event_type: The type of event to subscribe to.
             callback: The callback function to invoke when the event is published.
+            blocking: Set to True for sync callbacks that perform blocking work;
+                they are dispatched to a worker thread instead of being invoked
+                inline on the event loop.
         """
         if event_type not in self.subscribers:
             self.subscribers[event_type] = []
 
-        self.subscribers[event_type].append(callback)
-        callback_name = getattr(callback, "__name__", str(callback))
-        caller_frame = inspect.stack()[1]
-        caller_name = f"{caller_frame.function} (from {caller_frame.filename}:{caller_frame.lineno})"
-        self.logger.info(f"Callback '{callback_name}' subscribed to event: {event_type} by {caller_name}")
+        if asyncio.iscoroutinefunction(callback):
+            kind = self.ASYNC_CALLBACK
+        elif blocking:
+            kind = self.BLOCKING_SYNC_CALLBACK
+        else:
+            kind = self.SYNC_CALLBACK
+        self.subscribers[event_type].append((kind, callback))
+
+        if self.logger.isEnabledFor(logging.INFO):
+            callback_name = getattr(callback, "__name__", str(callback))
+            # sys._getframe only touches the caller's frame instead of walking
+            # and materializing the whole stack like inspect.stack() does.
+            caller_frame = sys._getframe(1)
+            caller_name = f"{caller_frame.f_code.co_name} (from {caller_frame.f_code.co_filename}:{caller_frame.f_lineno})"
+            self.logger.info(f"Callback '{callback_name}' subscribed to event: {event_type} by {caller_name}")
 
     async def publish(
         self, 
@@ -51,22 +77,27 @@ class EventBus:
     ) -> None:
         """
         Publishes an event asynchronously to all subscribers.
+
+        Subscribers are awaited sequentially in registration order: the bus
+        handlers have no true I/O parallelism to exploit, and skipping
+        `asyncio.gather` avoids allocating a gathering future plus a wrapper
+        task per callback on every publish.
         """
-        if event_type not in self.subscribers:
-            self.logger.warning(f"No subscribers for event: {event_type}")
+        subscribers = self.subscribers.get(event_type)
+        if not subscribers:
+            self.logger.warning("No subscribers for event: %s", event_type)
             return
 
-        self.logger.info(f"Publishing async event: {event_type} with data: {data}")
-        tasks = [
-            self._safe_invoke_async(callback, data) if asyncio.iscoroutinefunction(callback) 
-            else asyncio.to_thread(self._safe_invoke_sync, callback, data)
-            for callback in self.subscribers[event_type]
-        ]
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for result in results:
-                if isinstance(result, Exception):
-                    self.logger.error(f"Exception in async event callback: {result}", exc_info=True)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Publishing async event: {event_type} with data: {data}")
+
+        for kind, callback in subscribers:
+            if kind == self.ASYNC_CALLBACK:
+                await self._invoke_callback(callback, data)
+            elif kind == self.BLOCKING_SYNC_CALLBACK:
+                await asyncio.to_thread(self._safe_invoke_sync, callback, data)
+            else:
+                self._safe_invoke_sync(callback, data)
 
     def publish_sync(
         self, 
@@ -77,11 +108,22 @@ class EventBus:
         Publishes an event synchronously to all subscribers.
         """
         if event_type in self.subscribers:
-            self.logger.info(f"Publishing sync event: {event_type} with data: {data}")
-            loop = asyncio.get_event_loop()
-            for callback in self.subscribers[event_type]:
-                if asyncio.iscoroutinefunction(callback):
-                    asyncio.run_coroutine_threadsafe(self._safe_invoke_async(callback, data), loop)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Publishing sync event: {event_type} with data: {data}")
+
+            # get_running_loop avoids the deprecated (and slower) implicit
+            # loop creation of get_event_loop when called off the loop thread.
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+
+            for kind, callback in self.subscribers[event_type]:
+                if kind == self.ASYNC_CALLBACK:
+                    if loop is not None:
+                        asyncio.run_coroutine_threadsafe(self._safe_invoke_async(callback, data), loop)
+                    else:
+                        asyncio.run(self._invoke_callback(callback, data))
                 else:
                     self._safe_invoke_sync(callback, data)
 
@@ -101,7 +143,7 @@ class EventBus:
                 self._tasks.discard(completed_task)
 
         task.add_done_callback(remove_task)
-        self.logger.debug(f"Task created for callback '{callback.__name__}' with data: {data}")
+        self.logger.debug("Task created for callback '%s' with data: %s", callback.__name__, data)
     
     async def _invoke_callback(
         self, 
@@ -109,7 +151,7 @@ class EventBus:
         data: Any
     ) -> None:
         try:
-            self.logger.info(f"Executing async callback '{callback.__name__}' for event with data: {data}")
+            self.logger.info("Executing async callback '%s' for event with data: %s", callback.__name__, data)
             await callback(data)
         except Exception as e:
             self.logger.error(f"Error in async callback '{callback.__name__}': {e}", exc_info=True)
@@ -67,6 +67,8 @@ class GridTradingBot:
                 order_execution_strategy=order_execution_strategy,
                 event_bus=self.event_bus,
                 polling_interval=5.0,
+                exchange_service=self.exchange_service,
+                trading_pair=trading_pair,
             )
 
             order_manager = OrderManager(
@@ -0,0 +1,39 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy fallbacks below are used instead
+    njit = None
+
+
+def partition_by_central(prices: np.ndarray, central_price: float) -> np.ndarray:
+    """
+    Returns a boolean mask marking the grid prices at or below the central price.
+
+    Args:
+        prices: Sorted grid prices as a float64 array.
+        central_price: The central price splitting buy and sell grids.
+
+    Returns:
+        np.ndarray: Boolean mask, True for buy-side (<= central) prices.
+    """
+    return prices <= central_price
+
+
+def first_sell_above(sorted_sells: np.ndarray, price: float) -> int:
+    """
+    Returns the index of the first sell grid strictly above the given price.
+
+    Args:
+        sorted_sells: Sorted sell grid prices as a float64 array.
+        price: The buy level price to pair against.
+
+    Returns:
+        int: Index into `sorted_sells`, equal to its length if no grid is above.
+    """
+    return int(np.searchsorted(sorted_sells, price, side='right'))
+
+
+if njit is not None:
+    partition_by_central = njit(cache=True)(partition_by_central)
+    first_sell_above = njit(cache=True)(first_sell_above)
@@ -1,18 +1,34 @@
-from enum import Enum
-from typing import List, Optional
+from collections import deque
+from enum import IntFlag
+from typing import Deque, Optional
 from ..order_handling.order import Order
 
-class GridCycleState(Enum):
-    READY_TO_BUY_OR_SELL = "ready_to_buy_or_sell"  # Level is ready for both a buy or a sell order
-    READY_TO_BUY = "ready_to_buy"               # Level is ready for a buy order
-    WAITING_FOR_BUY_FILL = "waiting_for_buy_fill"  # Buy order placed, waiting for execution
-    READY_TO_SELL = "ready_to_sell"             # Level is ready for a sell order
-    WAITING_FOR_SELL_FILL = "waiting_for_sell_fill"  # Sell order placed, waiting for execution
+class GridCycleState(IntFlag):
+    """
+    Grid level states as distinct flag bits, so order-placement checks reduce
+    to a single bitwise AND against a per-side mask.
+    """
+    READY_TO_BUY_OR_SELL = 1   # Level is ready for both a buy or a sell order
+    READY_TO_BUY = 2           # Level is ready for a buy order
+    WAITING_FOR_BUY_FILL = 4   # Buy order placed, waiting for execution
+    READY_TO_SELL = 8          # Level is ready for a sell order
+    WAITING_FOR_SELL_FILL = 16 # Sell order placed, waiting for execution
 
 class GridLevel:
+    # Grids can hold hundreds of levels that live for the whole backtest;
+    # slots avoid a per-instance __dict__ and keep the hot pairing-loop
+    # attribute reads cache-friendly.
+    __slots__ = ('price', 'orders', 'state', 'paired_buy_level', 'paired_sell_level', 'sorted_index')
+
     def __init__(self, price: float, state: GridCycleState):
         self.price: float = price
-        self.orders: List[Order] = []  # Track all orders at this level
+        # Position of this level in the sorted price grid, assigned by
+        # GridManager at initialization; lets neighbour lookups index the
+        # price array directly instead of re-sorting and searching.
+        self.sorted_index: int = -1
+        # Only the most recent orders are kept; long backtests would otherwise
+        # accumulate every order ever placed at the level.
+        self.orders: Deque[Order] = deque(maxlen=32)
         self.state: GridCycleState = state
         self.paired_buy_level: Optional['GridLevel'] = None
         self.paired_sell_level: Optional['GridLevel'] = None 
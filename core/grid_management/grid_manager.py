@@ -4,6 +4,7 @@ import numpy as np
 from config.config_manager import ConfigManager
 from strategies.strategy_type import StrategyType
 from strategies.spacing_type import SpacingType
+from ._grid_math import first_sell_above, partition_by_central
 from .grid_level import GridLevel, GridCycleState
 from ..order_handling.order import Order, OrderSide
 
@@ -21,6 +22,32 @@ class GridManager:
         self.sorted_buy_grids: List[float]
         self.sorted_sell_grids: List[float]
         self.grid_levels: dict[float, GridLevel] = {}
+        # Levels in sorted-price order, so index-based lookups skip float
+        # hashing entirely; grid_levels stays the price-keyed public mapping.
+        self._levels_in_order: List[GridLevel] = []
+        self._sell_levels_in_order: List[GridLevel] = []
+        self._inv_total_grids: float = 0.0
+        self._static_paired_sell_levels: dict[GridLevel, GridLevel] = {}
+        self._price_grids_arr: np.ndarray = np.empty(0, dtype=np.float64)
+        self._sell_grids_arr: np.ndarray = np.empty(0, dtype=np.float64)
+        self._allowed_state_masks: dict[OrderSide, GridCycleState] = self._build_allowed_state_masks(strategy_type)
+
+    @staticmethod
+    def _build_allowed_state_masks(strategy_type: StrategyType) -> dict[OrderSide, GridCycleState]:
+        """
+        Precomputes, per order side, the bitmask of grid level states allowing an order.
+        """
+        if strategy_type == StrategyType.SIMPLE_GRID:
+            return {
+                OrderSide.BUY: GridCycleState.READY_TO_BUY,
+                OrderSide.SELL: GridCycleState.READY_TO_SELL,
+            }
+        elif strategy_type == StrategyType.HEDGED_GRID:
+            return {
+                OrderSide.BUY: GridCycleState.READY_TO_BUY | GridCycleState.READY_TO_BUY_OR_SELL,
+                OrderSide.SELL: GridCycleState.READY_TO_SELL | GridCycleState.READY_TO_BUY_OR_SELL,
+            }
+        return {OrderSide.BUY: GridCycleState(0), OrderSide.SELL: GridCycleState(0)}
     
     def initialize_grids_and_levels(self) -> None:
         """
@@ -37,11 +64,17 @@ class GridManager:
         - Sell grid levels are initialized with `READY_TO_SELL`.
         """
         self.price_grids, self.central_price = self._calculate_price_grids_and_central_price()
+        self._price_grids_arr = np.asarray(self.price_grids, dtype=np.float64)
 
         if self.strategy_type == StrategyType.SIMPLE_GRID:
-            self.sorted_buy_grids = [price_grid for price_grid in self.price_grids if price_grid <= self.central_price]
-            self.sorted_sell_grids = [price_grid for price_grid in self.price_grids if price_grid > self.central_price]
-            self.grid_levels = {price: GridLevel(price, GridCycleState.READY_TO_BUY if price <= self.central_price else GridCycleState.READY_TO_SELL) for price in self.price_grids}
+            buy_mask = partition_by_central(self._price_grids_arr, self.central_price)
+            self._sell_grids_arr = self._price_grids_arr[~buy_mask]
+            self.sorted_buy_grids = self._price_grids_arr[buy_mask].tolist()
+            self.sorted_sell_grids = self._sell_grids_arr.tolist()
+            self.grid_levels = {
+                price: GridLevel(price, GridCycleState.READY_TO_BUY if is_buy else GridCycleState.READY_TO_SELL)
+                for price, is_buy in zip(self._price_grids_arr.tolist(), buy_mask.tolist())
+            }
         
         elif self.strategy_type == StrategyType.HEDGED_GRID:
             self.sorted_buy_grids = self.price_grids[:-1]  # All except the top grid
@@ -53,6 +86,26 @@ class GridManager:
                 )
                 for price in self.price_grids
             }
+        # price_grids is already sorted, so each level's position doubles as an
+        # index into the price array for O(1) neighbour lookups.
+        for index, price in enumerate(self.price_grids):
+            self.grid_levels[price].sorted_index = index
+        self._levels_in_order = [self.grid_levels[price] for price in self.price_grids]
+        self._sell_levels_in_order = [self.grid_levels[price] for price in self.sorted_sell_grids]
+        # The grid count is fixed from here on; cache its reciprocal so order
+        # sizing is a multiply instead of a len() plus division per call.
+        self._inv_total_grids = 1.0 / len(self.grid_levels)
+
+        # The structurally paired sell level for each buy level (the first sell
+        # level above it) never changes, so compute it once; the runtime lookup
+        # only falls back to scanning when that level is busy.
+        if self.strategy_type == StrategyType.SIMPLE_GRID:
+            self._static_paired_sell_levels = {}
+            for buy_price in self.sorted_buy_grids:
+                start = first_sell_above(self._sell_grids_arr, buy_price)
+                if start < len(self._sell_levels_in_order):
+                    self._static_paired_sell_levels[self.grid_levels[buy_price]] = self._sell_levels_in_order[start]
+
         self.logger.info(f"Grids and levels initialized. Central price: {self.central_price}")
         self.logger.info(f"Price grids: {self.price_grids}")
         self.logger.info(f"Buy grids: {self.sorted_buy_grids}")
@@ -79,9 +132,7 @@ class GridManager:
         Returns:
             The calculated order size as a float.
         """
-        total_grids = len(self.grid_levels)
-        order_size = total_balance / total_grids / current_price
-        return order_size
+        return total_balance * self._inv_total_grids / current_price
 
     def get_initial_order_quantity(
         self, 
@@ -122,18 +173,39 @@ class GridManager:
             pairing_type: "buy" or "sell" to specify the type of pairing.
         """
         if pairing_type == "buy":
-            source_grid_level.paired_buy_level = target_grid_level
-            target_grid_level.paired_sell_level = source_grid_level
-            self.logger.info(f"Paired sell grid level {source_grid_level.price} with buy grid level {target_grid_level.price}.")
-            
+            self.pair_buy_level(source_grid_level, target_grid_level)
+
         elif pairing_type == "sell":
-            source_grid_level.paired_sell_level = target_grid_level
-            target_grid_level.paired_buy_level = source_grid_level
-            self.logger.info(f"Paired buy grid level {source_grid_level.price} with sell grid level {target_grid_level.price}.")
+            self.pair_sell_level(source_grid_level, target_grid_level)
 
         else:
             raise ValueError(f"Invalid pairing type: {pairing_type}. Must be 'buy' or 'sell'.")
-    
+
+    def pair_buy_level(
+        self,
+        sell_grid_level: GridLevel,
+        buy_grid_level: GridLevel
+    ) -> None:
+        """
+        Pairs a sell grid level with the buy grid level below it.
+        """
+        sell_grid_level.paired_buy_level = buy_grid_level
+        buy_grid_level.paired_sell_level = sell_grid_level
+        self.logger.info("Paired sell grid level %s with buy grid level %s.", sell_grid_level.price, buy_grid_level.price)
+
+    def pair_sell_level(
+        self,
+        buy_grid_level: GridLevel,
+        sell_grid_level: GridLevel
+    ) -> None:
+        """
+        Pairs a buy grid level with the sell grid level above it.
+        """
+        buy_grid_level.paired_sell_level = sell_grid_level
+        sell_grid_level.paired_buy_level = buy_grid_level
+        self.logger.info("Paired buy grid level %s with sell grid level %s.", buy_grid_level.price, sell_grid_level.price)
+
+
     def get_paired_sell_level(
         self, 
         buy_grid_level: GridLevel
@@ -149,33 +221,37 @@ class GridManager:
         """
         if self.strategy_type == StrategyType.SIMPLE_GRID:
             self.logger.info(f"Looking for paired sell level for buy level at {buy_grid_level}")
-            self.logger.info(f"Available sell grids: {self.sorted_sell_grids}")
-            
-            for sell_price in self.sorted_sell_grids:
-                sell_level = self.grid_levels[sell_price]
-                self.logger.info(f"Checking sell level {sell_price}, state: {sell_level.state}")
 
-                if sell_level and not self.can_place_order(sell_level, OrderSide.SELL):
-                    self.logger.info(f"Skipping sell level {sell_price} - cannot place order. State: {sell_level.state}")
+            # Fast path: the precomputed structural pairing, valid whenever
+            # that level can currently take a sell order.
+            static_sell_level = self._static_paired_sell_levels.get(buy_grid_level)
+            if static_sell_level is not None and self.can_place_order(static_sell_level, OrderSide.SELL):
+                self.logger.info(f"Paired sell level found at {static_sell_level.price} for buy level {buy_grid_level}.")
+                return static_sell_level
+
+            # sorted_sell_grids is sorted, so jump straight to the first level
+            # above the buy price instead of scanning from the start.
+            start = first_sell_above(self._sell_grids_arr, buy_grid_level.price)
+            for sell_level in self._sell_levels_in_order[start:]:
+                if not self.can_place_order(sell_level, OrderSide.SELL):
+                    self.logger.info(f"Skipping sell level {sell_level.price} - cannot place order. State: {sell_level.state}")
                     continue
 
-                if sell_price > buy_grid_level.price:
-                    self.logger.info(f"Paired sell level found at {sell_price} for buy level {buy_grid_level}.")
-                    return sell_level
+                self.logger.info(f"Paired sell level found at {sell_level.price} for buy level {buy_grid_level}.")
+                return sell_level
 
             self.logger.warning(f"No suitable sell level found above {buy_grid_level}")
             return None
     
         elif self.strategy_type == StrategyType.HEDGED_GRID:
-            self.logger.info(f"Available price grids: {self.price_grids}")
-            sorted_prices = sorted(self.price_grids)
-            current_index = sorted_prices.index(buy_grid_level.price)
+            # Levels carry their sorted position, so the paired sell level is
+            # simply the next entry in the ordered level list.
+            current_index = buy_grid_level.sorted_index
             self.logger.info(f"Current index of buy level {buy_grid_level.price}: {current_index}")
 
-            if current_index + 1 < len(sorted_prices):
-                paired_sell_price = sorted_prices[current_index + 1]
-                sell_level = self.grid_levels[paired_sell_price]
-                self.logger.info(f"Paired sell level for buy level {buy_grid_level.price} is at {paired_sell_price} (state: {sell_level.state})")
+            if 0 <= current_index < len(self._levels_in_order) - 1:
+                sell_level = self._levels_in_order[current_index + 1]
+                self.logger.info(f"Paired sell level for buy level {buy_grid_level.price} is at {sell_level.price} (state: {sell_level.state})")
                 return sell_level
         
             self.logger.warning(f"No suitable sell level found for buy grid level {buy_grid_level}")
@@ -195,12 +271,12 @@ class GridManager:
         Returns:
             The grid level below the given grid level, or None if it doesn't exist.
         """
-        sorted_levels = sorted(self.grid_levels.keys())
-        current_index = sorted_levels.index(grid_level.price)
+        # Levels carry their position in the sorted grid, so the neighbour is a
+        # direct index into price_grids instead of a sort plus linear search.
+        current_index = grid_level.sorted_index
 
         if current_index > 0:
-            lower_price = sorted_levels[current_index - 1]
-            return self.grid_levels[lower_price]
+            return self._levels_in_order[current_index - 1]
         return None
     
     def mark_order_pending(
@@ -282,20 +358,7 @@ class GridManager:
         Returns:
             bool: True if the order can be placed, False otherwise.
         """
-        if self.strategy_type == StrategyType.SIMPLE_GRID:
-            if order_side == OrderSide.BUY:
-                return grid_level.state == GridCycleState.READY_TO_BUY
-            elif order_side == OrderSide.SELL:
-                return grid_level.state == GridCycleState.READY_TO_SELL
-
-        elif self.strategy_type == StrategyType.HEDGED_GRID:
-            if order_side == OrderSide.BUY:
-                return grid_level.state in {GridCycleState.READY_TO_BUY, GridCycleState.READY_TO_BUY_OR_SELL}
-            elif order_side == OrderSide.SELL:
-                return grid_level.state in {GridCycleState.READY_TO_SELL, GridCycleState.READY_TO_BUY_OR_SELL}
-
-        else:
-            return False
+        return bool(grid_level.state & self._allowed_state_masks[order_side])
 
     def _extract_grid_config(self) -> Tuple[float, float, int, str]:
         """
@@ -319,18 +382,16 @@ class GridManager:
         bottom_range, top_range, num_grids, spacing_type = self._extract_grid_config()
         
         if spacing_type == SpacingType.ARITHMETIC:
-            grids = np.linspace(bottom_range, top_range, num_grids)
+            grids = np.linspace(bottom_range, top_range, num_grids).tolist()
             central_price = (top_range + bottom_range) / 2
 
         elif spacing_type == SpacingType.GEOMETRIC:
-            grids = []
-            ratio = (top_range / bottom_range) ** (1 / (num_grids - 1))
-            current_price = bottom_range
-
-            for _ in range(num_grids):
-                grids.append(current_price)
-                current_price *= ratio
-                
+            # Computing each level directly from its exponent in one vectorized
+            # expression replaces the per-level Python loop and avoids the
+            # rounding drift of repeated multiplication by the ratio.
+            exponents = np.arange(num_grids) / (num_grids - 1)
+            grids = (bottom_range * (top_range / bottom_range) ** exponents).tolist()
+
             central_index = len(grids) // 2
             if num_grids % 2 == 0:
                 central_price = (grids[central_index - 1] + grids[central_index]) / 2
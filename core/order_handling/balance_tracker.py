@@ -1,4 +1,5 @@
-import logging
+import logging, sys
+from typing import List, NamedTuple
 from config.trading_mode import TradingMode
 from .fee_calculator import FeeCalculator
 from .order import Order, OrderSide, OrderStatus
@@ -6,7 +7,22 @@ from core.bot_management.event_bus import EventBus, Events
 from ..validation.exceptions import InsufficientBalanceError, InsufficientCryptoBalanceError
 from core.services.exchange_interface import ExchangeInterface
 
+class BalanceSnapshot(NamedTuple):
+    """
+    Point-in-time view of the tracked balances, including reserved funds.
+    """
+    fiat: float
+    crypto: float
+    total_fees: float
+
+
 class BalanceTracker:
+    # Balances are stored as integers in fixed-point minor units (1e-8 of the
+    # currency) so long backtests do not accumulate float rounding drift and
+    # the per-fill arithmetic stays on fast integer ops. The float-facing
+    # properties below convert at the boundary.
+    UNITS_PER_WHOLE: int = 10**8
+
     def __init__(
         self, 
         event_bus: EventBus,
@@ -29,16 +45,70 @@ class BalanceTracker:
         self.event_bus: EventBus = event_bus
         self.fee_calculator: FeeCalculator = fee_calculator
         self.trading_mode: TradingMode = trading_mode
-        self.base_currency: str = base_currency
-        self.quote_currency: str = quote_currency
+        # Interned so the per-refresh balance-dict lookups compare by identity.
+        self.base_currency: str = sys.intern(base_currency) if isinstance(base_currency, str) else base_currency
+        self.quote_currency: str = sys.intern(quote_currency) if isinstance(quote_currency, str) else quote_currency
 
-        self.balance: float = 0.0
-        self.crypto_balance: float = 0.0
-        self.total_fees: float = 0
-        self.reserved_fiat: float = 0.0
-        self.reserved_crypto: float = 0.0
+        self._balance_units: int = 0
+        self._crypto_balance_units: int = 0
+        self._total_fee_units: int = 0
+        self._reserved_fiat_units: int = 0
+        self._reserved_crypto_units: int = 0
 
         self.event_bus.subscribe(Events.ORDER_FILLED, self._update_balance_on_order_completion)
+        self.event_bus.subscribe(Events.ORDERS_FILLED_BATCH, self._update_balances_on_orders_filled_batch)
+
+    def _to_units(self, amount: float) -> int:
+        """
+        Converts a float amount to integer fixed-point units.
+        """
+        return round(amount * self.UNITS_PER_WHOLE)
+
+    def _from_units(self, units: int) -> float:
+        """
+        Converts integer fixed-point units back to a float amount.
+        """
+        return units / self.UNITS_PER_WHOLE
+
+    @property
+    def balance(self) -> float:
+        return self._from_units(self._balance_units)
+
+    @balance.setter
+    def balance(self, value: float) -> None:
+        self._balance_units = self._to_units(value)
+
+    @property
+    def crypto_balance(self) -> float:
+        return self._from_units(self._crypto_balance_units)
+
+    @crypto_balance.setter
+    def crypto_balance(self, value: float) -> None:
+        self._crypto_balance_units = self._to_units(value)
+
+    @property
+    def total_fees(self) -> float:
+        return self._from_units(self._total_fee_units)
+
+    @total_fees.setter
+    def total_fees(self, value: float) -> None:
+        self._total_fee_units = self._to_units(value)
+
+    @property
+    def reserved_fiat(self) -> float:
+        return self._from_units(self._reserved_fiat_units)
+
+    @reserved_fiat.setter
+    def reserved_fiat(self, value: float) -> None:
+        self._reserved_fiat_units = self._to_units(value)
+
+    @property
+    def reserved_crypto(self) -> float:
+        return self._from_units(self._reserved_crypto_units)
+
+    @reserved_crypto.setter
+    def reserved_crypto(self, value: float) -> None:
+        self._reserved_crypto_units = self._to_units(value)
     
     async def setup_balances(
         self, 
@@ -81,28 +151,47 @@ class BalanceTracker:
         if not balances or 'free' not in balances:
             raise ValueError(f"Unexpected balance structure: {balances}")
 
-        quote_balance = float(balances.get('free', {}).get(self.quote_currency, 0.0))
-        base_balance = float(balances.get('free', {}).get(self.base_currency, 0.0))
+        free_balances = balances['free']
+        quote_balance = float(free_balances.get(self.quote_currency, 0.0))
+        base_balance = float(free_balances.get(self.base_currency, 0.0))
         self.logger.info(f"Fetched balances - Quote: {self.quote_currency}: {quote_balance}, Base: {self.base_currency}: {base_balance}")
         return quote_balance, base_balance
 
-    async def _update_balance_on_order_completion(self, order: Order) -> None:
+    def _update_balance_on_order_completion(self, order: Order) -> None:
         """
         Updates the account balance and crypto balance when an order is filled.
 
-        This method is called when an `ORDER_FILLED` event is received. It determines 
-        whether the filled order is a buy or sell order and updates the balances 
-        accordingly.
+        This method is called when an `ORDER_FILLED` event is received. It determines
+        whether the filled order is a buy or sell order and updates the balances
+        accordingly. It is deliberately a plain sync callback: the update is pure
+        arithmetic with no await points, so the EventBus invokes it inline
+        without scheduling a task.
 
         Args:
-            order: The filled `Order` object containing details such as the side 
+            order: The filled `Order` object containing details such as the side
                 (BUY/SELL), filled quantity, and price.
+
+        Note:
+            Fills are applied synchronously within the publish call on purpose:
+            the backtest loop and the paired-order placement logic read the
+            balances as soon as `publish` returns, so deferring updates to a
+            queue-draining task would let them observe stale balances.
         """
         if order.side == OrderSide.BUY:
             self._update_after_buy_order_filled(order.filled, order.price)
         elif order.side == OrderSide.SELL:
             self._update_after_sell_order_filled(order.filled, order.price)
 
+    def _update_balances_on_orders_filled_batch(self, orders: List[Order]) -> None:
+        """
+        Applies a batch of fills published as a single `ORDERS_FILLED_BATCH` event.
+
+        Args:
+            orders: The filled `Order` objects from one backtest bar.
+        """
+        for order in orders:
+            self._update_balance_on_order_completion(order)
+
     def _update_after_buy_order_filled(
         self, 
         quantity: float, 
@@ -119,17 +208,22 @@ class BalanceTracker:
             quantity: The quantity of crypto purchased.
             price: The price at which the crypto was purchased (per unit).
         """
-        fee = self.fee_calculator.calculate_fee(quantity * price)
-        total_cost = quantity * price + fee
-
-        self.reserved_fiat -= total_cost
-        if self.reserved_fiat < 0:
-            self.balance += self.reserved_fiat  # Adjust with excess reserved fiat
-            self.reserved_fiat = 0
-    
-        self.crypto_balance += quantity
-        self.total_fees += fee
-        self.logger.info(f"Buy order completed: {quantity} crypto purchased at {price}.")
+        trade_value = quantity * price
+        fee_units = self._to_units(self.fee_calculator.calculate_fee(trade_value))
+
+        # Work on locals and commit once: attribute stores on self are much
+        # slower than LOAD_FAST/STORE_FAST in this per-fill hot path.
+        reserved_fiat_units = self._reserved_fiat_units - (self._to_units(trade_value) + fee_units)
+        balance_units = self._balance_units
+        if reserved_fiat_units < 0:
+            balance_units += reserved_fiat_units  # Adjust with excess reserved fiat
+            reserved_fiat_units = 0
+
+        self._reserved_fiat_units = reserved_fiat_units
+        self._balance_units = balance_units
+        self._crypto_balance_units += self._to_units(quantity)
+        self._total_fee_units += fee_units
+        self.logger.info("Buy order completed: %s crypto purchased at %s.", quantity, price)
 
     def _update_after_sell_order_filled(
         self, 
@@ -147,17 +241,21 @@ class BalanceTracker:
             quantity: The quantity of crypto sold.
             price: The price at which the crypto was sold (per unit).
         """
-        fee = self.fee_calculator.calculate_fee(quantity * price)
-        sale_proceeds = quantity * price - fee
-        self.reserved_crypto -= quantity
-
-        if self.reserved_crypto < 0:
-            self.crypto_balance += abs(self.reserved_crypto)  # Adjust with excess reserved crypto
-            self.reserved_crypto = 0
-
-        self.balance += sale_proceeds
-        self.total_fees += fee
-        self.logger.info(f"Sell order completed: {quantity} crypto sold at {price}.")
+        trade_value = quantity * price
+        fee_units = self._to_units(self.fee_calculator.calculate_fee(trade_value))
+        sale_proceeds_units = self._to_units(trade_value) - fee_units
+
+        reserved_crypto_units = self._reserved_crypto_units - self._to_units(quantity)
+        crypto_balance_units = self._crypto_balance_units
+        if reserved_crypto_units < 0:
+            crypto_balance_units += -reserved_crypto_units  # Adjust with excess reserved crypto
+            reserved_crypto_units = 0
+
+        self._reserved_crypto_units = reserved_crypto_units
+        self._crypto_balance_units = crypto_balance_units
+        self._balance_units += sale_proceeds_units
+        self._total_fee_units += fee_units
+        self.logger.info("Sell order completed: %s crypto sold at %s.", quantity, price)
     
     def update_after_initial_purchase(self, initial_order: Order):
         """
@@ -169,12 +267,12 @@ class BalanceTracker:
         if initial_order.status != OrderStatus.CLOSED:
             raise ValueError(f"Order {initial_order.id} is not CLOSED. Cannot update balances.")
     
-        total_cost = initial_order.filled * initial_order.average
-        fee = self.fee_calculator.calculate_fee(initial_order.amount * initial_order.average)
-        
-        self.crypto_balance += initial_order.filled
-        self.balance -= total_cost + fee
-        self.total_fees += fee
+        total_cost_units = self._to_units(initial_order.filled * initial_order.average)
+        fee_units = self._to_units(self.fee_calculator.calculate_fee(initial_order.amount * initial_order.average))
+
+        self._crypto_balance_units += self._to_units(initial_order.filled)
+        self._balance_units -= total_cost_units + fee_units
+        self._total_fee_units += fee_units
         self.logger.info(f"Updated balances. Crypto balance: {self.crypto_balance}, Fiat balance: {self.balance}, Total fees: {self.total_fees}")
 
     def reserve_funds_for_buy(
@@ -187,12 +285,13 @@ class BalanceTracker:
         Args:
             amount: The amount of fiat to reserve.
         """
-        if self.balance < amount:
+        amount_units = self._to_units(amount)
+        if self._balance_units < amount_units:
             raise InsufficientBalanceError(f"Insufficient fiat balance to reserve {amount}.")
 
-        self.reserved_fiat += amount
-        self.balance -= amount
-        self.logger.info(f"Reserved {amount} fiat for a buy order. Remaining fiat balance: {self.balance}.")
+        self._reserved_fiat_units += amount_units
+        self._balance_units -= amount_units
+        self.logger.info("Reserved %s fiat for a buy order. Remaining fiat balance: %s.", amount, self.balance)
 
     def reserve_funds_for_sell(
         self, 
@@ -204,12 +303,43 @@ class BalanceTracker:
         Args:
             quantity: The quantity of crypto to reserve.
         """
-        if self.crypto_balance < quantity:
+        quantity_units = self._to_units(quantity)
+        if self._crypto_balance_units < quantity_units:
             raise InsufficientCryptoBalanceError(f"Insufficient crypto balance to reserve {quantity}.")
 
-        self.reserved_crypto += quantity
-        self.crypto_balance -= quantity
-        self.logger.info(f"Reserved {quantity} crypto for a sell order. Remaining crypto balance: {self.crypto_balance}.")
+        self._reserved_crypto_units += quantity_units
+        self._crypto_balance_units -= quantity_units
+        self.logger.info("Reserved %s crypto for a sell order. Remaining crypto balance: %s.", quantity, self.crypto_balance)
+
+    def release_reserved_buy_funds(
+        self,
+        amount: float
+    ) -> None:
+        """
+        Returns fiat reserved for a buy order that was never placed back to the main balance.
+
+        Args:
+            amount: The amount of fiat to release.
+        """
+        amount_units = min(self._to_units(amount), self._reserved_fiat_units)
+        self._reserved_fiat_units -= amount_units
+        self._balance_units += amount_units
+        self.logger.info("Released %s reserved fiat. Fiat balance: %s.", amount, self.balance)
+
+    def release_reserved_sell_funds(
+        self,
+        quantity: float
+    ) -> None:
+        """
+        Returns crypto reserved for a sell order that was never placed back to the main balance.
+
+        Args:
+            quantity: The quantity of crypto to release.
+        """
+        quantity_units = min(self._to_units(quantity), self._reserved_crypto_units)
+        self._reserved_crypto_units -= quantity_units
+        self._crypto_balance_units += quantity_units
+        self.logger.info("Released %s reserved crypto. Crypto balance: %s.", quantity, self.crypto_balance)
 
     def get_adjusted_fiat_balance(self) -> float:
         """
@@ -218,7 +348,7 @@ class BalanceTracker:
         Returns:
             float: The total fiat balance including reserved funds.
         """
-        return self.balance + self.reserved_fiat
+        return self._from_units(self._balance_units + self._reserved_fiat_units)
 
     def get_adjusted_crypto_balance(self) -> float:
         """
@@ -227,7 +357,23 @@ class BalanceTracker:
         Returns:
             float: The total crypto balance including reserved funds.
         """
-        return self.crypto_balance + self.reserved_crypto
+        return self._from_units(self._crypto_balance_units + self._reserved_crypto_units)
+
+    def snapshot(self) -> BalanceSnapshot:
+        """
+        Returns a consistent snapshot of the adjusted balances and total fees.
+
+        Useful for analytics code that reads several balances together; a single
+        call replaces three separate accessor round-trips.
+
+        Returns:
+            BalanceSnapshot: The adjusted fiat/crypto balances and total fees.
+        """
+        return BalanceSnapshot(
+            fiat=self._from_units(self._balance_units + self._reserved_fiat_units),
+            crypto=self._from_units(self._crypto_balance_units + self._reserved_crypto_units),
+            total_fees=self._from_units(self._total_fee_units),
+        )
 
     def get_total_balance_value(self, price: float) -> float:
         """
@@ -239,4 +385,7 @@ class BalanceTracker:
         Returns:
             float: The total account value in fiat terms.
         """
-        return self.get_adjusted_fiat_balance() + self.get_adjusted_crypto_balance() * price
\ No newline at end of file
+        # Read the unit fields directly: this runs once per candle in backtests,
+        # so it skips the intermediate accessor calls.
+        return self._from_units(self._balance_units + self._reserved_fiat_units) + \
+            self._from_units(self._crypto_balance_units + self._reserved_crypto_units) * price
\ No newline at end of file
@@ -1,24 +1,90 @@
-import logging, asyncio
-from typing import Optional
+import logging, asyncio, random
+from typing import List, Optional, Tuple
 from ..order import Order, OrderType, OrderSide, OrderStatus
 from core.services.exchange_interface import ExchangeInterface
 from core.services.exceptions import DataFetchError
 from .order_execution_strategy_interface import OrderExecutionStrategyInterface
 from ..exceptions import OrderExecutionFailedError
 
+# Precomputed once so the order hot path does a dict lookup instead of
+# rebuilding the same lowercase string on every placement attempt.
+_ORDER_TYPE_STR = {order_type: order_type.value.lower() for order_type in OrderType}
+_ORDER_SIDE_STR = {order_side: order_side.name.lower() for order_side in OrderSide}
+
+# Slippage is added for buys and subtracted for sells; encoding the direction as
+# a sign keeps _adjust_price branchless.
+_SIDE_SIGN = {OrderSide.BUY: 1.0, OrderSide.SELL: -1.0}
+
 class LiveOrderExecutionStrategy(OrderExecutionStrategyInterface):
+    KEEPALIVE_INTERVAL = 20.0
+
     def __init__(
-        self, 
-        exchange_service: ExchangeInterface, 
-        max_retries: int = 3, 
-        retry_delay: int = 1, 
-        max_slippage: float = 0.01
+        self,
+        exchange_service: ExchangeInterface,
+        max_retries: int = 3,
+        retry_delay: int = 1,
+        max_slippage: float = 0.01,
+        retry_base: float = 0.1,
+        retry_cap: float = 5.0,
+        ack_timeout: float = 5.0
     ) -> None:
         self.exchange_service = exchange_service
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.retry_base = retry_base
+        self.retry_cap = retry_cap
+        self.ack_timeout = ack_timeout
         self.max_slippage = max_slippage
+        self._slippage_step = max_slippage / max_retries
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._keepalive_task: Optional[asyncio.Task] = None
+
+    async def warmup(self) -> None:
+        """
+        Primes the exchange connection before the first order is placed.
+
+        The first request on a cold connection pays the TCP+TLS handshake on top
+        of the exchange roundtrip; issuing a lightweight authenticated call up
+        front moves that cost out of the order hot path.
+        """
+        try:
+            await self.exchange_service.get_balance()
+            self.logger.info("Exchange connection warmed up.")
+
+        except Exception as e:
+            self.logger.warning(f"Exchange connection warmup failed: {e}")
+
+    def start_keepalive(self) -> None:
+        """
+        Starts a background task that periodically pings the exchange so the
+        underlying connection does not idle out between orders.
+        """
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+    async def stop_keepalive(self) -> None:
+        """
+        Cancels the keepalive task started by start_keepalive, if any.
+        """
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+            self._keepalive_task = None
+
+    async def _keepalive_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.KEEPALIVE_INTERVAL)
+            try:
+                await self.exchange_service.get_balance()
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                self.logger.debug("Keepalive ping failed: %s", e)
 
     async def execute_market_order(
         self, 
@@ -28,23 +94,44 @@ class LiveOrderExecutionStrategy(OrderExecutionStrategyInterface):
         price: float
     ) -> Optional[Order]:
         for attempt in range(self.max_retries):
+            placement = asyncio.ensure_future(
+                self.exchange_service.place_order(pair, _ORDER_TYPE_STR[OrderType.MARKET], _ORDER_SIDE_STR[order_side], quantity, price)
+            )
             try:
-                raw_order = await self.exchange_service.place_order(pair, OrderType.MARKET.value.lower(), order_side.name.lower(), quantity, price)
-                order_result = await self._parse_order_result(raw_order)
-                
+                try:
+                    # The placement is shielded so a late acknowledgement never
+                    # cancels the HTTP request itself: a market order can have
+                    # executed on the exchange even though the response is slow,
+                    # and re-placing it blind would double-spend real funds.
+                    raw_order = await asyncio.wait_for(asyncio.shield(placement), timeout=self.ack_timeout)
+
+                except asyncio.TimeoutError:
+                    # The submission may still land; wait for its actual outcome
+                    # (bounded by the transport's own timeout) before deciding
+                    # whether a retry is needed at all.
+                    self.logger.warning(f"Attempt {attempt + 1}: no acknowledgement within {self.ack_timeout}s; awaiting in-flight order result before retrying.")
+                    raw_order = await placement
+
+                order_result = self._parse_order_result(raw_order)
+
                 if order_result.status == OrderStatus.CLOSED:
                     return order_result  # Order fully filled
 
                 elif order_result.status == OrderStatus.OPEN:
                     await self._handle_partial_fill(order_result, pair)
 
-                await asyncio.sleep(self.retry_delay)
                 self.logger.info(f"Retrying order. Attempt {attempt + 1}/{self.max_retries}.")
-                price = await self._adjust_price(order_side, price, attempt)
+                price = self._adjust_price(order_side, price, attempt)
+
+            except asyncio.CancelledError:
+                # Only external cancellation (e.g. shutdown) lands here; release
+                # the shielded request instead of leaking it.
+                placement.cancel()
+                raise
 
             except Exception as e:
                 self.logger.error(f"Attempt {attempt + 1} failed with error: {str(e)}")
-                await asyncio.sleep(self.retry_delay)
+                await asyncio.sleep(self._backoff(attempt))
 
         raise OrderExecutionFailedError("Failed to execute Market order after maximum retries.", order_side, OrderType.MARKET, pair, quantity, price)
     
@@ -56,8 +143,8 @@ class LiveOrderExecutionStrategy(OrderExecutionStrategyInterface):
         price: float
     ) -> Optional[Order]:
         try:
-            raw_order = await self.exchange_service.place_order(pair, OrderType.LIMIT.value.lower(), order_side.name.lower(), quantity, price)
-            order_result = await self._parse_order_result(raw_order)
+            raw_order = await self.exchange_service.place_order(pair, _ORDER_TYPE_STR[OrderType.LIMIT], _ORDER_SIDE_STR[order_side], quantity, price)
+            order_result = self._parse_order_result(raw_order)
             return order_result
         
         except DataFetchError as e:
@@ -68,6 +155,50 @@ class LiveOrderExecutionStrategy(OrderExecutionStrategyInterface):
             self.logger.error(f"Unexpected error in execute_limit_order: {e}")
             raise OrderExecutionFailedError(f"Unexpected error during order execution: {e}", order_side, OrderType.LIMIT, pair, quantity, price)
 
+    async def execute_limit_orders_batch(
+        self,
+        orders: List[Tuple[OrderSide, str, float, float]]
+    ) -> List[Order]:
+        """
+        Executes several limit orders in a single exchange roundtrip.
+
+        Grid initialization places one limit order per level; sending them as one
+        batch avoids paying a full network roundtrip per grid level.
+
+        Args:
+            orders: A list of (order_side, pair, quantity, price) tuples.
+
+        Returns:
+            A list of Order objects, one per submitted order.
+        """
+        if not orders:
+            return []
+
+        order_requests = [
+            {
+                'symbol': pair,
+                'type': _ORDER_TYPE_STR[OrderType.LIMIT],
+                'side': _ORDER_SIDE_STR[order_side],
+                'amount': quantity,
+                'price': price,
+            }
+            for order_side, pair, quantity, price in orders
+        ]
+
+        try:
+            raw_orders = await self.exchange_service.place_orders_batch(order_requests)
+            return [self._parse_order_result(raw_order) for raw_order in raw_orders]
+
+        except DataFetchError as e:
+            order_side, pair, quantity, price = orders[0]
+            self.logger.error(f"DataFetchError during batch order execution for {pair} - {e}")
+            raise OrderExecutionFailedError(f"Failed to execute batch of {len(orders)} limit orders on {pair}: {e}", order_side, OrderType.LIMIT, pair, quantity, price)
+
+        except Exception as e:
+            order_side, pair, quantity, price = orders[0]
+            self.logger.error(f"Unexpected error in execute_limit_orders_batch: {e}")
+            raise OrderExecutionFailedError(f"Unexpected error during batch order execution: {e}", order_side, OrderType.LIMIT, pair, quantity, price)
+
     async def get_order(
         self, 
         order_id: str,
@@ -75,7 +206,7 @@ class LiveOrderExecutionStrategy(OrderExecutionStrategyInterface):
     ) -> Optional[Order]:
         try:
             raw_order = await self.exchange_service.fetch_order(order_id, pair)
-            order_result = await self._parse_order_result(raw_order)
+            order_result = self._parse_order_result(raw_order)
             return order_result
 
         except DataFetchError as e:
@@ -84,13 +215,17 @@ class LiveOrderExecutionStrategy(OrderExecutionStrategyInterface):
         except Exception as e:
             raise DataFetchError(f"Unexpected error during order status retrieval: {str(e)}")
 
-    async def _parse_order_result(
+    def _parse_order_result(
         self, 
         raw_order_result: dict
     ) -> Order:
         """
         Parses the raw order response from the exchange into an Order object.
 
+        This is plain attribute mapping with no I/O, so it is a synchronous
+        helper: making it a coroutine would add a coroutine allocation and an
+        event-loop scheduling point per parsed order for nothing.
+
         Args:
             raw_order_result: The raw response from the exchange.
 
@@ -118,14 +253,26 @@ class LiveOrderExecutionStrategy(OrderExecutionStrategyInterface):
             info=raw_order_result.get("info", raw_order_result),
         )
 
-    async def _adjust_price(
-        self, 
-        order_side: OrderSide, 
-        price: float, 
+    def _backoff(
+        self,
+        attempt: int
+    ) -> float:
+        """
+        Returns a full-jitter exponential backoff delay for the given attempt.
+
+        A fixed retry delay makes every bot instance hammer the exchange at the
+        same cadence during an outage; exponential growth with jitter spreads
+        the retries out instead.
+        """
+        return min(self.retry_cap, self.retry_base * (2 ** attempt)) * (0.5 + random.random() * 0.5)
+
+    def _adjust_price(
+        self,
+        order_side: OrderSide,
+        price: float,
         attempt: int
     ) -> float:
-        adjustment = self.max_slippage / self.max_retries * attempt
-        return price * (1 + adjustment) if order_side == OrderSide.BUY else price * (1 - adjustment)
+        return price * (1.0 + _SIDE_SIGN[order_side] * self._slippage_step * attempt)
     
     async def _handle_partial_fill(
         self, 
@@ -155,5 +302,5 @@ class LiveOrderExecutionStrategy(OrderExecutionStrategyInterface):
             except Exception as e:
                 self.logger.warning(f"Error during cancel attempt {cancel_attempt + 1} for order {order_id}: {str(e)}")
 
-            await asyncio.sleep(self.retry_delay)
+            await asyncio.sleep(self._backoff(cancel_attempt))
         return False
\ No newline at end of file
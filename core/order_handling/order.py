@@ -19,6 +19,15 @@ class OrderStatus(Enum):
     UNKNOWN = "unknown"
 
 class Order:
+    # Orders are allocated per placement and per simulated fill; slots keep them
+    # compact and make field access a fixed offset instead of a dict lookup.
+    __slots__ = (
+        'identifier', 'status', 'order_type', 'side', 'price', 'average',
+        'amount', 'filled', 'remaining', 'timestamp', 'datetime',
+        'last_trade_timestamp', 'symbol', 'time_in_force', 'trades', 'fee',
+        'cost', 'info',
+    )
+
     def __init__(
         self,
         identifier: str,
@@ -8,7 +8,11 @@ class OrderBook:
         self.sell_orders: List[Order] = []
         self.non_grid_orders: List[Order] = []  # Orders that are not linked to any grid level
         self.order_to_grid_map: Dict[Order, GridLevel] = {}  # Mapping of Order -> GridLevel
-    
+        # Price-keyed indexes of open orders, kept in sync on add and pruned
+        # lazily as orders close, so per-price lookups avoid scanning the book.
+        self._open_buy_orders_by_price: Dict[float, List[Order]] = {}
+        self._open_sell_orders_by_price: Dict[float, List[Order]] = {}
+
     def add_order(
         self,
         order: Order,
@@ -16,14 +20,50 @@ class OrderBook:
     ) -> None:
         if order.side == OrderSide.BUY:
             self.buy_orders.append(order)
+            open_orders_by_price = self._open_buy_orders_by_price
         else:
             self.sell_orders.append(order)
+            open_orders_by_price = self._open_sell_orders_by_price
+
+        if order.is_open():
+            open_orders_by_price.setdefault(order.price, []).append(order)
 
         if grid_level:
             self.order_to_grid_map[order] = grid_level # Store the grid level associated with this order
         else:
             self.non_grid_orders.append(order) # This is a non-grid order like take profit or stop loss
-    
+
+    def get_open_orders_at_price(
+        self,
+        side: OrderSide,
+        price: float
+    ) -> List[Order]:
+        """
+        Returns the open orders for a side at an exact price, without scanning the book.
+
+        Orders whose status changed since indexing are pruned from the bucket on
+        the way through, so the indexes stay tidy without hooking every status change.
+        """
+        open_orders_by_price = self._open_buy_orders_by_price if side == OrderSide.BUY else self._open_sell_orders_by_price
+        bucket = open_orders_by_price.get(price)
+
+        if not bucket:
+            return []
+
+        open_orders = [order for order in bucket if order.is_open()]
+        if len(open_orders) != len(bucket):
+            if open_orders:
+                open_orders_by_price[price] = open_orders
+            else:
+                del open_orders_by_price[price]
+        return open_orders
+
+    def has_open_order_prices(self) -> bool:
+        """
+        Returns True when any price bucket may still hold open orders.
+        """
+        return bool(self._open_buy_orders_by_price or self._open_sell_orders_by_price)
+
     def get_buy_orders_with_grid(self) -> List[Tuple[Order, Optional[GridLevel]]]:
         return [(order, self.order_to_grid_map.get(order, None)) for order in self.buy_orders]
     
@@ -1,7 +1,8 @@
-import logging
-from typing import Union, Optional
+import asyncio, logging
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Awaitable, Iterable, Optional
 from datetime import datetime
-import pandas as pd
 from .order import Order, OrderSide, OrderStatus
 from ..order_handling.balance_tracker import BalanceTracker
 from ..order_handling.order_book import OrderBook
@@ -17,6 +18,8 @@ from config.trading_mode import TradingMode
 from .exceptions import OrderExecutionFailedError
 
 class OrderManager:
+    INITIAL_ORDERS_MAX_CONCURRENCY = 8
+
     def __init__(
         self, 
         grid_manager: GridManager,
@@ -41,96 +44,171 @@ class OrderManager:
         self.trading_mode: TradingMode = trading_mode
         self.trading_pair = trading_pair
         self.strategy_type: StrategyType = strategy_type
+        self._balance_lock = asyncio.Lock()
         self.event_bus.subscribe(Events.ORDER_FILLED, self._on_order_filled)
+        self.event_bus.subscribe(Events.ORDERS_FILLED_BATCH, self._on_orders_filled_batch)
         self.event_bus.subscribe(Events.ORDER_CANCELLED, self._on_order_cancelled)
-    
+
     async def initialize_grid_orders(
-        self, 
+        self,
         current_price: float
     ):
         """
         Places initial buy orders for grid levels below the current price.
+
+        Order placement is I/O bound with no data dependency between grid levels,
+        so the per-level coroutines run through a bounded pool instead of awaiting
+        each exchange roundtrip sequentially. Balance reads and reservations are
+        serialized behind a lock so concurrent levels cannot reserve the same funds.
         """
-        for price in self.grid_manager.sorted_buy_grids:
-            if price >= current_price:
-                self.logger.info(f"Skipping grid level at price: {price} for BUY order: Above current price.")
-                continue
-
-            grid_level = self.grid_manager.grid_levels[price]
-            total_balance_value = self.balance_tracker.get_total_balance_value(current_price)
-            order_quantity = self.grid_manager.get_order_size_for_grid_level(total_balance_value, current_price)
-
-            if self.grid_manager.can_place_order(grid_level, OrderSide.BUY):
-                try:
-                    adjusted_buy_order_quantity = self.order_validator.adjust_and_validate_buy_quantity(
-                        balance=self.balance_tracker.balance,
-                        order_quantity=order_quantity,
-                        price=price
-                    )
-
-                    self.logger.info(f"Placing initial buy limit order at grid level {price} for {adjusted_buy_order_quantity} {self.trading_pair}.")
-                    order = await self.order_execution_strategy.execute_limit_order(
-                        OrderSide.BUY, 
-                        self.trading_pair, 
-                        adjusted_buy_order_quantity, 
-                        price
-                    )
-
-                    if order is None:
-                        self.logger.error(f"Failed to place buy order at {price}: No order returned.")
-                        continue
-
-                    self.balance_tracker.reserve_funds_for_buy(adjusted_buy_order_quantity * price)
-                    self.grid_manager.mark_order_pending(grid_level, order)
-                    self.order_book.add_order(order, grid_level)
-
-                except OrderExecutionFailedError as e:
-                    self.logger.error(f"Failed to initialize buy order at grid level {price} - {str(e)}", exc_info=True)
-                    await self.notification_handler.async_send_notification(NotificationType.ORDER_FAILED, error_details=f"Error while placing initial buy order. {e}")
-
-                except Exception as e:
-                    self.logger.error(f"Unexpected error during buy order initialization at grid level {price}: {e}", exc_info=True)
-                    await self.notification_handler.async_send_notification(NotificationType.ERROR_OCCURRED, error_details=f"Error while placing initial buy order: {str(e)}")
-        
-        for price in self.grid_manager.sorted_sell_grids:
-            if price <= current_price:
-                self.logger.info(f"Skipping grid level at price: {price} for SELL order: Below or equal to current price.")
-                continue
-
-            grid_level = self.grid_manager.grid_levels[price]
-            total_balance_value = self.balance_tracker.get_total_balance_value(current_price)
-            order_quantity = self.grid_manager.get_order_size_for_grid_level(total_balance_value, current_price)
-
-            if self.grid_manager.can_place_order(grid_level, OrderSide.SELL):
-                try:
-                    adjusted_sell_order_quantity = self.order_validator.adjust_and_validate_sell_quantity(
-                        crypto_balance=self.balance_tracker.crypto_balance,
-                        order_quantity=order_quantity
-                    )
-
-                    self.logger.info(f"Placing initial sell limit order at grid level {price} for {adjusted_sell_order_quantity} {self.trading_pair}.")
-                    order = await self.order_execution_strategy.execute_limit_order(
-                        OrderSide.SELL, 
-                        self.trading_pair, 
-                        adjusted_sell_order_quantity, 
-                        price
-                    )
-
-                    if order is None:
-                        self.logger.error(f"Failed to place sell order at {price}: No order returned.")
-                        continue
-
-                    self.balance_tracker.reserve_funds_for_sell(adjusted_sell_order_quantity)
-                    self.grid_manager.mark_order_pending(grid_level, order)
-                    self.order_book.add_order(order, grid_level)
-
-                except OrderExecutionFailedError as e:
-                    self.logger.error(f"Failed to initialize sell order at grid level {price} - {str(e)}", exc_info=True)
-                    await self.notification_handler.async_send_notification(NotificationType.ORDER_FAILED, error_details=f"Error while placing initial sell order. {e}")
-
-                except Exception as e:
-                    self.logger.error(f"Unexpected error during sell order initialization at grid level {price}: {e}", exc_info=True)
-                    await self.notification_handler.async_send_notification(NotificationType.ERROR_OCCURRED, error_details=f"Error while placing initial sell order: {str(e)}")
+        # The grid lists are sorted, so the eligible levels are a prefix of the buy
+        # grids and a suffix of the sell grids; slice straight to them instead of
+        # scanning every level and skipping the ineligible ones.
+        buy_grids = self.grid_manager.sorted_buy_grids
+        sell_grids = self.grid_manager.sorted_sell_grids
+        eligible_buy_grids = buy_grids[:bisect_left(buy_grids, current_price)]
+        eligible_sell_grids = sell_grids[bisect_right(sell_grids, current_price):]
+        self.logger.info(f"Initializing grid orders: {len(eligible_buy_grids)} buy levels below and {len(eligible_sell_grids)} sell levels above current price {current_price}.")
+
+        # Both values depend only on current_price: reservations move funds
+        # between balance and reserved buckets, and get_total_balance_value
+        # counts both, so the total is invariant across the whole init pass.
+        # Compute them once instead of once per grid level.
+        total_balance_value = self.balance_tracker.get_total_balance_value(current_price)
+        order_quantity = self.grid_manager.get_order_size_for_grid_level(total_balance_value, current_price)
+
+        initial_order_coros = [self._place_initial_buy_order(price, order_quantity) for price in eligible_buy_grids]
+        initial_order_coros += [self._place_initial_sell_order(price, order_quantity) for price in eligible_sell_grids]
+
+        await self._run_coros_in_pool(initial_order_coros, self.INITIAL_ORDERS_MAX_CONCURRENCY)
+
+    async def _run_coros_in_pool(
+        self,
+        coros: Iterable[Awaitable[None]],
+        max_concurrency: int
+    ) -> None:
+        """
+        Runs coroutines with at most max_concurrency in flight, launching the next
+        one as soon as any pending coroutine completes.
+        """
+        coro_iterator = iter(coros)
+        pending = {asyncio.ensure_future(coro) for coro in islice(coro_iterator, max_concurrency)}
+
+        while pending:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for coro in coro_iterator:
+                pending.add(asyncio.ensure_future(coro))
+                if len(pending) >= max_concurrency:
+                    break
+
+    async def _place_initial_buy_order(
+        self,
+        price: float,
+        order_quantity: float
+    ) -> None:
+        """
+        Validates and places a single initial buy limit order for the grid level at price.
+        """
+        grid_level = self.grid_manager.grid_levels[price]
+
+        if not self.grid_manager.can_place_order(grid_level, OrderSide.BUY):
+            return
+
+        reserved_fiat = None
+        try:
+            async with self._balance_lock:
+                adjusted_buy_order_quantity = self.order_validator.adjust_and_validate_buy_quantity(
+                    balance=self.balance_tracker.balance,
+                    order_quantity=order_quantity,
+                    price=price
+                )
+                self.balance_tracker.reserve_funds_for_buy(adjusted_buy_order_quantity * price)
+                reserved_fiat = adjusted_buy_order_quantity * price
+
+            self.logger.info(f"Placing initial buy limit order at grid level {price} for {adjusted_buy_order_quantity} {self.trading_pair}.")
+            order = await self.order_execution_strategy.execute_limit_order(
+                OrderSide.BUY,
+                self.trading_pair,
+                adjusted_buy_order_quantity,
+                price
+            )
+
+            if order is None:
+                self.logger.error(f"Failed to place buy order at {price}: No order returned.")
+                async with self._balance_lock:
+                    self.balance_tracker.release_reserved_buy_funds(reserved_fiat)
+                return
+
+            self.grid_manager.mark_order_pending(grid_level, order)
+            self.order_book.add_order(order, grid_level)
+
+        except OrderExecutionFailedError as e:
+            self.logger.error(f"Failed to initialize buy order at grid level {price} - {str(e)}", exc_info=True)
+            if reserved_fiat is not None:
+                async with self._balance_lock:
+                    self.balance_tracker.release_reserved_buy_funds(reserved_fiat)
+            await self.notification_handler.async_send_notification(NotificationType.ORDER_FAILED, error_details=f"Error while placing initial buy order. {e}")
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during buy order initialization at grid level {price}: {e}", exc_info=True)
+            if reserved_fiat is not None:
+                async with self._balance_lock:
+                    self.balance_tracker.release_reserved_buy_funds(reserved_fiat)
+            await self.notification_handler.async_send_notification(NotificationType.ERROR_OCCURRED, error_details=f"Error while placing initial buy order: {str(e)}")
+
+    async def _place_initial_sell_order(
+        self,
+        price: float,
+        order_quantity: float
+    ) -> None:
+        """
+        Validates and places a single initial sell limit order for the grid level at price.
+        """
+        grid_level = self.grid_manager.grid_levels[price]
+
+        if not self.grid_manager.can_place_order(grid_level, OrderSide.SELL):
+            return
+
+        reserved_crypto = None
+        try:
+            async with self._balance_lock:
+                adjusted_sell_order_quantity = self.order_validator.adjust_and_validate_sell_quantity(
+                    crypto_balance=self.balance_tracker.crypto_balance,
+                    order_quantity=order_quantity
+                )
+                self.balance_tracker.reserve_funds_for_sell(adjusted_sell_order_quantity)
+                reserved_crypto = adjusted_sell_order_quantity
+
+            self.logger.info(f"Placing initial sell limit order at grid level {price} for {adjusted_sell_order_quantity} {self.trading_pair}.")
+            order = await self.order_execution_strategy.execute_limit_order(
+                OrderSide.SELL,
+                self.trading_pair,
+                adjusted_sell_order_quantity,
+                price
+            )
+
+            if order is None:
+                self.logger.error(f"Failed to place sell order at {price}: No order returned.")
+                async with self._balance_lock:
+                    self.balance_tracker.release_reserved_sell_funds(reserved_crypto)
+                return
+
+            self.grid_manager.mark_order_pending(grid_level, order)
+            self.order_book.add_order(order, grid_level)
+
+        except OrderExecutionFailedError as e:
+            self.logger.error(f"Failed to initialize sell order at grid level {price} - {str(e)}", exc_info=True)
+            if reserved_crypto is not None:
+                async with self._balance_lock:
+                    self.balance_tracker.release_reserved_sell_funds(reserved_crypto)
+            await self.notification_handler.async_send_notification(NotificationType.ORDER_FAILED, error_details=f"Error while placing initial sell order. {e}")
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during sell order initialization at grid level {price}: {e}", exc_info=True)
+            if reserved_crypto is not None:
+                async with self._balance_lock:
+                    self.balance_tracker.release_reserved_sell_funds(reserved_crypto)
+            await self.notification_handler.async_send_notification(NotificationType.ERROR_OCCURRED, error_details=f"Error while placing initial sell order: {str(e)}")
 
     async def _on_order_cancelled(
         self, 
@@ -145,6 +223,22 @@ class OrderManager:
         ## TODO: place new limit Order
         await self.notification_handler.async_send_notification(NotificationType.ORDER_CANCELLED, order_details=str(order))  
 
+    async def _on_orders_filled_batch(
+        self,
+        orders: list[Order]
+    ) -> None:
+        """
+        Handles a batch of orders filled within the same backtest bar.
+
+        Completions run sequentially: each one mutates shared balance state and
+        may place a paired order, so fanning them out concurrently would race.
+
+        Args:
+            orders: The filled Order instances for this bar.
+        """
+        for order in orders:
+            await self._on_order_filled(order)
+
     async def _on_order_filled(
         self, 
         order: Order
@@ -270,17 +364,18 @@ class OrderManager:
             grid_level: The grid level to place the buy order on.
             quantity: The quantity of the buy order.
         """
-        adjusted_quantity = self.order_validator.adjust_and_validate_buy_quantity(self.balance_tracker.balance, quantity, buy_grid_level.price)
+        buy_price = buy_grid_level.price
+        adjusted_quantity = self.order_validator.adjust_and_validate_buy_quantity(self.balance_tracker.balance, quantity, buy_price)
         buy_order = await self.order_execution_strategy.execute_limit_order(
-            OrderSide.BUY, 
-            self.trading_pair, 
-            adjusted_quantity, 
-            buy_grid_level.price
+            OrderSide.BUY,
+            self.trading_pair,
+            adjusted_quantity,
+            buy_price
         )
 
         if buy_order:
-            self.grid_manager.pair_grid_levels(sell_grid_level, buy_grid_level, pairing_type="buy")
-            self.balance_tracker.reserve_funds_for_buy(buy_order.amount * buy_grid_level.price)
+            self.grid_manager.pair_buy_level(sell_grid_level, buy_grid_level)
+            self.balance_tracker.reserve_funds_for_buy(buy_order.amount * buy_price)
             self.grid_manager.mark_order_pending(buy_grid_level, buy_order)
             self.order_book.add_order(buy_order, buy_grid_level)
             await self.notification_handler.async_send_notification(NotificationType.ORDER_PLACED, order_details=str(buy_order))  
@@ -300,16 +395,17 @@ class OrderManager:
             grid_level: The grid level to place the sell order on.
             quantity: The quantity of the sell order.
         """
+        sell_price = sell_grid_level.price
         adjusted_quantity = self.order_validator.adjust_and_validate_sell_quantity(self.balance_tracker.crypto_balance, quantity)
         sell_order = await self.order_execution_strategy.execute_limit_order(
-            OrderSide.SELL, 
-            self.trading_pair, 
-            adjusted_quantity, 
-            sell_grid_level.price
+            OrderSide.SELL,
+            self.trading_pair,
+            adjusted_quantity,
+            sell_price
         )
 
         if sell_order:
-            self.grid_manager.pair_grid_levels(buy_grid_level, sell_grid_level, pairing_type="sell")
+            self.grid_manager.pair_sell_level(buy_grid_level, sell_grid_level)
             self.balance_tracker.reserve_funds_for_sell(sell_order.amount)
             self.grid_manager.mark_order_pending(sell_grid_level, sell_order)
             self.order_book.add_order(sell_order, sell_grid_level)
@@ -411,10 +507,10 @@ class OrderManager:
             await self.notification_handler.async_send_notification(NotificationType.ERROR_OCCURRED, error_details=f"Failed to place {event} order: {e}")
     
     async def simulate_order_fills(
-        self, 
-        high_price: float, 
-        low_price: float, 
-        timestamp: Union[int, pd.Timestamp]
+        self,
+        high_price: float,
+        low_price: float,
+        timestamp: int
     ) -> None:
         """
         Simulates the execution of limit orders based on crossed grid levels within the high-low price range.
@@ -422,26 +518,77 @@ class OrderManager:
         Args:
             high_price: The highest price reached in this time interval.
             low_price: The lowest price reached in this time interval.
-            timestamp: The current timestamp in the backtest simulation.
+            timestamp: The current Unix timestamp (in seconds) in the backtest
+                simulation. The backtest driver converts its timestamp index
+                once up front, keeping pandas type checks out of this per-bar path.
+
+        Note:
+            Fill detection is intentionally evaluated per bar rather than
+            precomputed over the whole series in a compiled kernel: the set of
+            pending orders changes as fills trigger paired orders, so which
+            orders exist at a given bar depends on every bar before it. The
+            per-bar work is two bisections plus dict lookups, so the remaining
+            cost is the unavoidable per-fill state mutation and event dispatch.
         """
-        timestamp_val = int(timestamp.timestamp()) if isinstance(timestamp, pd.Timestamp) else int(timestamp)
-        pending_orders = self.order_book.get_open_orders()
-        crossed_buy_levels = [level for level in self.grid_manager.sorted_buy_grids if low_price <= level <= high_price]
-        crossed_sell_levels = [level for level in self.grid_manager.sorted_sell_grids if low_price <= level <= high_price]
+        if not self.order_book.has_open_order_prices():
+            return
+
+        # The grid lists are sorted, so the levels crossed by this candle form a
+        # contiguous slice found with two bisections instead of a full scan.
+        buy_grids = self.grid_manager.sorted_buy_grids
+        sell_grids = self.grid_manager.sorted_sell_grids
+        crossed_buy_levels = buy_grids[bisect_left(buy_grids, low_price):bisect_right(buy_grids, high_price)]
+        crossed_sell_levels = sell_grids[bisect_left(sell_grids, low_price):bisect_right(sell_grids, high_price)]
 
-        self.logger.debug(f"Simulating fills: High {high_price}, Low {low_price}, Pending orders: {len(pending_orders)}")
+        self.logger.debug(f"Simulating fills: High {high_price}, Low {low_price}")
         self.logger.debug(f"Crossed buy levels: {crossed_buy_levels}, Crossed sell levels: {crossed_sell_levels}")
 
-        for order in pending_orders:
-            if order.side == OrderSide.BUY and order.price in crossed_buy_levels:
-                await self._simulate_fill(order, timestamp_val)
+        # Mark all fills for this bar first and publish them as one batch, so the
+        # subscriber chain is dispatched once per bar instead of once per fill.
+        # The order book keeps per-price indexes of open orders, so each crossed
+        # level is a dict lookup rather than a scan over every pending order.
+        filled_orders: list[Order] = []
+        for level in crossed_buy_levels:
+            for order in self.order_book.get_open_orders_at_price(OrderSide.BUY, level):
+                self._mark_order_filled(order, timestamp)
+                filled_orders.append(order)
+
+        for level in crossed_sell_levels:
+            for order in self.order_book.get_open_orders_at_price(OrderSide.SELL, level):
+                self._mark_order_filled(order, timestamp)
+                filled_orders.append(order)
+
+        if filled_orders:
+            await self.event_bus.publish(Events.ORDERS_FILLED_BATCH, filled_orders)
+
+    def _mark_order_filled(
+        self,
+        order: Order,
+        timestamp: int
+    ) -> None:
+        """
+        Marks an order as fully filled at the given timestamp without publishing.
 
-            elif order.side == OrderSide.SELL and order.price in crossed_sell_levels:
-                await self._simulate_fill(order, timestamp_val)
+        Args:
+            order: The order to mark as filled.
+            timestamp: The timestamp at which the order is filled.
+        """
+        order.filled = order.amount
+        order.remaining = 0.0
+        order.status = OrderStatus.CLOSED
+        order.timestamp = timestamp
+        order.last_trade_timestamp = timestamp
+
+        # Formatting the timestamp costs a datetime allocation per fill, so only
+        # pay for it when INFO logging is actually emitted.
+        if self.logger.isEnabledFor(logging.INFO):
+            timestamp_in_seconds = timestamp / 1000 if timestamp > 10**10 else timestamp
+            formatted_timestamp = datetime.fromtimestamp(timestamp_in_seconds).isoformat(sep=' ', timespec='seconds')
+            self.logger.info(f"Simulated fill for {order.side.value.upper()} order at price {order.price} with amount {order.amount}. Filled at timestamp {formatted_timestamp}")
 
     async def _simulate_fill(
-        self, 
-        order: Order, 
+        self,
+        order: Order,
         timestamp: int
     ) -> None:
         """
@@ -451,12 +598,5 @@ class OrderManager:
             order: The order to simulate a fill for.
             timestamp: The timestamp at which the order is filled.
         """
-        order.filled = order.amount
-        order.remaining = 0.0
-        order.status = OrderStatus.CLOSED 
-        order.timestamp = timestamp
-        order.last_trade_timestamp = timestamp
-        timestamp_in_seconds = timestamp / 1000 if timestamp > 10**10 else timestamp
-        formatted_timestamp = datetime.fromtimestamp(timestamp_in_seconds).strftime('%Y-%m-%d %H:%M:%S')
-        self.logger.info(f"Simulated fill for {order.side.value.upper()} order at price {order.price} with amount {order.amount}. Filled at timestamp {formatted_timestamp}")
+        self._mark_order_filled(order, timestamp)
         await self.event_bus.publish(Events.ORDER_FILLED, order)
\ No newline at end of file
@@ -15,6 +15,8 @@ class OrderStatusTracker:
         order_execution_strategy,
         event_bus: EventBus,
         polling_interval: float = 15.0,
+        exchange_service=None,
+        trading_pair=None,
     ):
         """
         Initializes the OrderStatusTracker.
@@ -24,15 +26,71 @@ class OrderStatusTracker:
             order_execution_strategy: Strategy for querying order statuses from the exchange.
             event_bus: EventBus instance for publishing state change events.
             polling_interval: Time interval (in seconds) between status checks.
+            exchange_service: Optional exchange service; when it exposes a private
+                order update stream, fills are consumed from the stream instead of
+                being polled.
+            trading_pair: The trading pair to watch on the order update stream.
         """
         self.order_book = order_book
         self.order_execution_strategy = order_execution_strategy
         self.event_bus = event_bus
         self.polling_interval = polling_interval
+        self.exchange_service = exchange_service
+        self.trading_pair = trading_pair
         self._monitoring_task = None
         self._active_tasks = set()
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    def _supports_order_stream(self) -> bool:
+        """
+        Returns True when the exchange service can stream private order updates
+        and the venue actually supports them; exposing the stream method alone
+        is not enough, since ccxt raises NotSupported at watch time on venues
+        without private order streaming.
+        """
+        return (
+            self.exchange_service is not None
+            and self.trading_pair is not None
+            and hasattr(self.exchange_service, "listen_to_order_updates")
+            and bool(getattr(self.exchange_service, "supports_order_updates", lambda: False)())
+        )
+
+    async def _track_order_statuses_via_stream(self) -> None:
+        """
+        Consumes order updates pushed over the exchange WebSocket, so fills are
+        detected when the exchange emits them instead of on the next polling pass.
+
+        If the stream ends for any reason other than cancellation, tracking
+        falls back to polling: a dead tracker would leave live fills undetected
+        while the bot keeps placing orders.
+        """
+        try:
+            await self.exchange_service.listen_to_order_updates(self.trading_pair, self._on_order_update)
+
+        except asyncio.CancelledError:
+            self.logger.info("OrderStatusTracker stream task was cancelled.")
+            await self._cancel_active_tasks()
+            return
+
+        except Exception as error:
+            self.logger.error(f"Unexpected error in OrderStatusTracker stream: {error}")
+
+        self.logger.warning("Order update stream ended; falling back to polling open order statuses.")
+        await self._track_open_order_statuses()
+
+    async def _on_order_update(self, raw_order: dict) -> None:
+        """
+        Handles a single raw order update pushed by the exchange.
+        """
+        try:
+            # The execution strategy owns the raw-order-to-Order mapping; reuse it
+            # so streamed updates go through the same parsing as polled ones.
+            remote_order = self.order_execution_strategy._parse_order_result(raw_order)
+            self._handle_order_status_change(remote_order)
+
+        except Exception as error:
+            self.logger.error(f"Failed to process streamed order update: {error}", exc_info=True)
+
     async def _track_open_order_statuses(self) -> None:
         """
         Periodically checks the statuses of open orders and updates their states.
@@ -136,8 +194,13 @@ class OrderStatusTracker:
         if self._monitoring_task and not self._monitoring_task.done():
             self.logger.warning("OrderStatusTracker is already running.")
             return
-        self._monitoring_task = asyncio.create_task(self._track_open_order_statuses())
-        self.logger.info("OrderStatusTracker has started tracking open orders.")
+
+        if self._supports_order_stream():
+            self._monitoring_task = asyncio.create_task(self._track_order_statuses_via_stream())
+            self.logger.info("OrderStatusTracker has started consuming the order update stream.")
+        else:
+            self._monitoring_task = asyncio.create_task(self._track_open_order_statuses())
+            self.logger.info("OrderStatusTracker has started tracking open orders.")
 
     async def stop_tracking(self) -> None:
         """
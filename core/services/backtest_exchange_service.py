@@ -1,5 +1,5 @@
 import ccxt, logging, time, os
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Union
 import pandas as pd
 from config.config_manager import ConfigManager
 from utils.constants import CANDLE_LIMITS, TIMEFRAME_MAPPINGS
@@ -161,6 +161,12 @@ class BacktestExchangeService(ExchangeInterface):
     ) -> Dict[str, Union[str, float]]:
         raise NotImplementedError("place_order is not used in backtesting")
 
+    async def place_orders_batch(
+        self,
+        orders: List[Dict[str, Any]]
+    ) -> List[Dict[str, Union[str, float]]]:
+        raise NotImplementedError("place_orders_batch is not used in backtesting")
+
     async def get_balance(self) -> Dict[str, Any]:
         raise NotImplementedError("get_balance is not used in backtesting")
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Union, Optional, Any
+from typing import Dict, List, Union, Optional, Any
 import pandas as pd
 
 class ExchangeInterface(ABC):
@@ -19,7 +19,19 @@ class ExchangeInterface(ABC):
     ) -> Dict[str, Union[str, float]]:
         """Places an order, returning a dictionary with order details including id and status."""
         pass
-    
+
+    @abstractmethod
+    async def place_orders_batch(
+        self,
+        orders: List[Dict[str, Any]]
+    ) -> List[Dict[str, Union[str, float]]]:
+        """
+        Places several orders in a single exchange call where supported, returning one
+        result dictionary per order. Each order is a dict with symbol, type, side,
+        amount and price keys.
+        """
+        pass
+
     @abstractmethod
     def fetch_ohlcv(
         self, 
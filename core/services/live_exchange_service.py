@@ -1,7 +1,7 @@
 import ccxt, logging, asyncio, os
 from ccxt.base.errors import NetworkError, BaseError, ExchangeError, OrderNotFound
 import ccxt.pro as ccxtpro
-from typing import Dict, Union, Callable, Any, Optional
+from typing import Dict, List, Union, Callable, Any, Optional
 import pandas as pd
 from config.config_manager import ConfigManager
 from .exchange_interface import ExchangeInterface
@@ -20,7 +20,11 @@ class LiveExchangeService(ExchangeInterface):
         self.api_key = self._get_env_variable("EXCHANGE_API_KEY")
         self.secret_key = self._get_env_variable("EXCHANGE_SECRET_KEY")
         self.exchange = self._initialize_exchange()
+        # Each stream owns its liveness flag: the ticker and order-update loops
+        # run concurrently, so sharing one flag would let either stream's
+        # shutdown tear the other one down.
         self.connection_active = False
+        self.order_stream_active = False
     
     def _get_env_variable(self, key: str) -> str:
         value = os.getenv(key)
@@ -30,6 +34,10 @@ class LiveExchangeService(ExchangeInterface):
 
     def _initialize_exchange(self) -> None:
         try:
+            # ccxt.pro runs its REST and WebSocket traffic over aiohttp, which
+            # sets TCP_NODELAY on every transport it opens, so small order
+            # frames are flushed immediately instead of being coalesced by
+            # Nagle's algorithm. No extra socket tuning is needed here.
             exchange = getattr(ccxtpro, self.exchange_name)({
                 'apiKey': self.api_key,
                 'secret': self.secret_key,
@@ -108,15 +116,76 @@ class LiveExchangeService(ExchangeInterface):
                         self.logger.error(f"Error while closing WebSocket connection: {e}", exc_info=True)
 
     async def listen_to_ticker_updates(
-        self, 
-        pair: str, 
+        self,
+        pair: str,
         on_price_update: Callable[[float], None],
         update_interval: float
     ) -> None:
         await self._subscribe_to_ticker_updates(pair, on_price_update, update_interval)
 
+    async def listen_to_order_updates(
+        self,
+        pair: str,
+        on_order_update: Callable[[Dict[str, Any]], Any],
+        max_retries: int = 5
+    ) -> None:
+        """
+        Streams private order updates over the exchange WebSocket.
+
+        Fills arrive as soon as the exchange emits them instead of being
+        discovered on the next polling pass, so fill-detection latency drops
+        from up to one polling interval to the WebSocket push latency.
+
+        Args:
+            pair: The trading pair to watch orders for.
+            on_order_update: Async callback invoked with each raw order update dict.
+            max_retries: Consecutive connection errors tolerated before giving up.
+        """
+        self.order_stream_active = True
+        retry_count = 0
+
+        while self.order_stream_active:
+            try:
+                raw_orders = await self.exchange.watch_orders(pair)
+
+                if not self.order_stream_active:
+                    break
+
+                for raw_order in raw_orders:
+                    await on_order_update(raw_order)
+                retry_count = 0
+
+            except (NetworkError, ExchangeError) as e:
+                retry_count += 1
+                retry_interval = min(retry_count * 5, 60)
+                self.logger.error(f"Error on order update stream for {pair}: {e}. Retrying in {retry_interval} seconds ({retry_count}/{max_retries}).")
+
+                if retry_count >= max_retries:
+                    self.logger.error("Max retries reached. Stopping order update stream.")
+                    self.order_stream_active = False
+                    break
+
+                await asyncio.sleep(retry_interval)
+
+            except asyncio.CancelledError:
+                self.logger.info(f"Order update stream for {pair} was cancelled.")
+                self.order_stream_active = False
+                raise
+
+            except Exception as e:
+                self.logger.error(f"Order update stream error: {e}. Reconnecting...")
+                await asyncio.sleep(5)
+
+    def supports_order_updates(self) -> bool:
+        """
+        Returns True when the venue's ccxt client can stream private order
+        updates; venues without watchOrders raise NotSupported at watch time.
+        """
+        return bool(self.exchange.has.get('watchOrders'))
+
     async def close_connection(self) -> None:
         self.connection_active = False
+        self.order_stream_active = False
         self.logger.info("Closing WebSocket connection...")
 
     async def get_balance(self) -> Dict[str, Any]:
@@ -156,6 +225,55 @@ class LiveExchangeService(ExchangeInterface):
         except Exception as e:
             raise DataFetchError(f"Unexpected error placing order: {str(e)}")
 
+    async def place_orders_batch(
+        self,
+        orders: List[Dict[str, Any]]
+    ) -> List[Dict[str, Union[str, float]]]:
+        """
+        Places several orders in one exchange roundtrip when the exchange exposes a
+        batch endpoint, instead of paying one HTTP request per order. Exchanges
+        without batch support fall back to concurrent single-order calls over the
+        already established ccxt connection.
+        """
+        try:
+            if self.exchange.has.get('createOrders'):
+                return await self.exchange.create_orders(orders)
+
+            results = await asyncio.gather(*[
+                self.exchange.create_order(order['symbol'], order['type'], order['side'], order['amount'], order.get('price'))
+                for order in orders
+            ], return_exceptions=True)
+
+            failures = [result for result in results if isinstance(result, BaseException)]
+            if not failures:
+                return results
+
+            # A partial batch must not strand live orders: anything that did
+            # land has no local tracking or reserved funds yet, so unwind it
+            # and surface a clean all-or-nothing failure to the caller.
+            for order, result in zip(orders, results):
+                if isinstance(result, BaseException):
+                    continue
+                try:
+                    await self.exchange.cancel_order(result['id'], order['symbol'])
+
+                except Exception as cancel_error:
+                    self.logger.error(f"Failed to cancel order {result.get('id')} while unwinding a partial batch: {cancel_error}", exc_info=True)
+
+            raise DataFetchError(f"{len(failures)} of {len(orders)} batch orders failed; successful placements were cancelled. First error: {failures[0]}")
+
+        except DataFetchError:
+            raise
+
+        except NetworkError as e:
+            raise DataFetchError(f"Network issue occurred while placing batch orders: {str(e)}")
+
+        except BaseError as e:
+            raise DataFetchError(f"Error placing batch orders: {str(e)}")
+
+        except Exception as e:
+            raise DataFetchError(f"Unexpected error placing batch orders: {str(e)}")
+
     async def fetch_order(
         self, 
         order_id: str,
@@ -15,10 +15,12 @@ from config.exceptions import ConfigError
 from utils.logging_config import setup_logging
 from utils.config_name_generator import generate_config_name
 
+# The validator is stateless, so one instance serves every config.
+_CONFIG_VALIDATOR = ConfigValidator()
+
 def initialize_config(config_path: str) -> ConfigManager:
-    load_dotenv()
     try:
-        return ConfigManager(config_path, ConfigValidator())
+        return ConfigManager(config_path, _CONFIG_VALIDATOR)
 
     except ConfigError as e:
         logging.error(f"An error occured during the initialization of ConfigManager {e}")
@@ -45,18 +47,39 @@ async def run_bot(
     health_check = HealthCheck(bot, notification_handler, event_bus)
     
     if profile:
-        cProfile.runctx("asyncio.run(bot.run())", globals(), locals(), "profile_results.prof")
+        try:
+            import yappi
+        except ImportError:
+            yappi = None
+
+        if yappi is not None:
+            # yappi's asyncio backend attributes wall time to the coroutine
+            # actually running, where cProfile charges every await to the
+            # caller and buries the real hot spots under gather frames.
+            yappi.set_clock_type("wall")
+            yappi.set_context_backend("asyncio")
+            yappi.start()
+            try:
+                await bot.run()
+            finally:
+                yappi.stop()
+                yappi.get_func_stats().save("profile_results.prof", type="pstat")
+        else:
+            cProfile.runctx("asyncio.run(bot.run())", globals(), locals(), "profile_results.prof")
         return None
 
     try:
         if bot.trading_mode in {TradingMode.LIVE, TradingMode.PAPER_TRADING}:
-            bot_task = asyncio.create_task(bot.run(), name="BotTask")
-            bot_controller_task = asyncio.create_task(bot_controller.command_listener(), name="BotControllerTask")
-            health_check_task = asyncio.create_task(health_check.start(), name="HealthCheckTask")
-            await asyncio.gather(bot_task, bot_controller_task, health_check_task)
+            # TaskGroup gives structured cancellation: if any of the three
+            # tasks fails, the siblings are cancelled immediately instead of
+            # lingering until the later cleanup sweep finds them.
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(bot.run(), name="BotTask")
+                task_group.create_task(bot_controller.command_listener(), name="BotControllerTask")
+                task_group.create_task(health_check.start(), name="HealthCheckTask")
         else:
             await bot.run()
-    
+
     except asyncio.CancelledError:
         logging.info("Cancellation received. Shutting down gracefully.")
 
@@ -95,26 +118,46 @@ async def cleanup_tasks():
         logging.error(f"Error during task cancellation: {e}", exc_info=True)
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass  # uvloop is an optional accelerator; the default loop works everywhere
+
+    # Load the .env once for the whole process instead of once per config.
+    load_dotenv()
     args = parse_and_validate_console_args()
-    
+
     async def main():
-        try:
-            tasks = [
-                run_bot(config_path, args.profile, args.save_performance_results, args.no_plot)
-                for config_path in args.config
-            ]
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for index, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logging.error(
-                        f"Error occurred while running bot for config {args.config[index]}: {result}",
-                        exc_info=True
-                    )
+        # Python 3.12+: run event-bus callbacks eagerly up to their first
+        # suspension instead of scheduling them on the next loop iteration.
+        # Older Pythons fall back to the default task factory.
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+        # Cap how many bots run at once so a long config list does not open
+        # every exchange session simultaneously on the same loop.
+        semaphore = asyncio.Semaphore(args.max_concurrent) if args.max_concurrent > 0 else None
+
+        async def run_bot_for_config(config_path: str) -> None:
+            try:
+                if semaphore is not None:
+                    async with semaphore:
+                        result = await run_bot(config_path, args.profile, args.save_performance_results, args.no_plot)
                 else:
-                    if args.save_performance_results:
-                        save_or_append_performance_results(result, args.save_performance_results)
+                    result = await run_bot(config_path, args.profile, args.save_performance_results, args.no_plot)
+
+                # Save as each bot finishes instead of waiting for the slowest one.
+                if args.save_performance_results:
+                    save_or_append_performance_results(result, args.save_performance_results)
+
+            except Exception as e:
+                logging.error(f"Error occurred while running bot for config {config_path}: {e}", exc_info=True)
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for config_path in args.config:
+                    task_group.create_task(run_bot_for_config(config_path), name=f"RunBot-{config_path}")
 
         except Exception as e:
             logging.error(f"Critical error in main: {e}", exc_info=True)
@@ -4,6 +4,12 @@ setup(
     name='grid_trading_bot',
     version='1.0',
     packages=find_packages(),
+    extras_require={
+        # Optional faster event loop; main.py picks it up automatically when installed.
+        'uvloop': ['uvloop'],
+        # Async-aware profiler used by --profile when available.
+        'profile': ['yappi'],
+    },
     entry_points={
         'console_scripts': [
             'grid_trading_bot=run_bot:main',
@@ -10,6 +10,7 @@ from core.services.exchange_interface import ExchangeInterface
 from core.grid_management.grid_manager import GridManager
 from core.order_handling.order_manager import OrderManager
 from core.order_handling.balance_tracker import BalanceTracker
+from core.order_handling.execution_strategy.live_order_execution_strategy import LiveOrderExecutionStrategy
 from strategies.trading_performance_analyzer import TradingPerformanceAnalyzer
 from strategies.plotter import Plotter
 
@@ -39,6 +40,12 @@ class GridTradingStrategy(TradingStrategyInterface):
         self.trading_mode = trading_mode
         self.trading_pair = trading_pair
         self.plotter = plotter
+        # TP/SL settings cannot change within a session; cache them so the
+        # per-tick checks read attributes instead of config-manager calls.
+        self._take_profit_enabled = config_manager.is_take_profit_enabled()
+        self._take_profit_threshold = config_manager.get_take_profit_threshold()
+        self._stop_loss_enabled = config_manager.is_stop_loss_enabled()
+        self._stop_loss_threshold = config_manager.get_stop_loss_threshold()
         self.data = self._initialize_historical_data()
         self.live_trading_metrics = [] 
         self._running = True
@@ -132,6 +139,13 @@ class GridTradingStrategy(TradingStrategyInterface):
         last_price: Optional[float] = None
         grid_orders_initialized = False
 
+        # Warm up the exchange connection so the first order placed does not pay
+        # the TCP+TLS handshake, and keep it hot for the rest of the session.
+        order_execution_strategy = getattr(self.order_manager, "order_execution_strategy", None)
+        if isinstance(order_execution_strategy, LiveOrderExecutionStrategy):
+            await order_execution_strategy.warmup()
+            order_execution_strategy.start_keepalive()
+
         async def on_ticker_update(current_price):
             nonlocal last_price, grid_orders_initialized
             try:
@@ -170,8 +184,10 @@ class GridTradingStrategy(TradingStrategyInterface):
         
         except Exception as e:
             self.logger.error(f"Error in live/paper trading loop: {e}", exc_info=True)
-        
+
         finally:
+            if isinstance(order_execution_strategy, LiveOrderExecutionStrategy):
+                await order_execution_strategy.stop_keepalive()
             self.logger.info("Exiting live/paper trading loop.")
 
     async def _run_backtest(self, trigger_price: float) -> None:
@@ -189,35 +205,52 @@ class GridTradingStrategy(TradingStrategyInterface):
             return
 
         self.logger.info("Starting backtest simulation")
-        self.data['account_value'] = np.nan
         self.close_prices = self.data['close'].values
         high_prices = self.data['high'].values
         low_prices = self.data['low'].values
-        timestamps = self.data.index
-        self.data.loc[timestamps[0], 'account_value'] = self.balance_tracker.get_total_balance_value(price=self.close_prices[0])
+        # Convert the timestamp index to Unix seconds once up front, so the
+        # per-bar fill simulation takes a plain int instead of re-checking and
+        # converting a pandas Timestamp on every candle.
+        timestamps_in_seconds = self.data.index.asi8 // 10**9
+        # Accumulate per-candle account values in a plain array and write the
+        # column once at the end: a label-based .loc scalar write per candle
+        # costs an index lookup and dtype check each time.
+        account_values = np.full(len(self.close_prices), np.nan, dtype=np.float64)
+        account_values[0] = self.balance_tracker.get_total_balance_value(price=self.close_prices[0])
+        # The TP/SL thresholds are fixed for the whole run, so flag the candles
+        # that can trigger them in one vectorized pass; the loop then skips the
+        # per-candle TP/SL await everywhere else.
+        tp_sl_candidates = self._precompute_tp_sl_candidates(self.close_prices)
         grid_orders_initialized = False
         last_price = None
 
-        for i, (current_price, high_price, low_price, timestamp) in enumerate(zip(self.close_prices, high_prices, low_prices, timestamps)):
+        # Iterating the ndarrays directly would box a fresh np.float64 for
+        # every element of every column; tolist() converts to plain floats
+        # once so the loop iterates without per-bar allocations.
+        price_rows = zip(self.close_prices.tolist(), high_prices.tolist(), low_prices.tolist())
+
+        for i, (current_price, high_price, low_price) in enumerate(price_rows):
             grid_orders_initialized = await self._initialize_grid_orders_once(
-                current_price, 
+                current_price,
                 trigger_price,
                 grid_orders_initialized,
                 last_price
             )
 
             if not grid_orders_initialized:
-                self.data.loc[timestamps[i], 'account_value'] = self.balance_tracker.get_total_balance_value(price=current_price)
+                account_values[i] = self.balance_tracker.get_total_balance_value(price=current_price)
                 last_price = current_price
                 continue
 
-            await self.order_manager.simulate_order_fills(high_price, low_price, timestamp)
+            await self.order_manager.simulate_order_fills(high_price, low_price, int(timestamps_in_seconds[i]))
 
-            if await self._handle_take_profit_stop_loss(current_price):
+            if tp_sl_candidates[i] and await self._handle_take_profit_stop_loss(current_price):
                 break
 
-            self.data.loc[timestamp, 'account_value'] = self.balance_tracker.get_total_balance_value(current_price)
+            account_values[i] = self.balance_tracker.get_total_balance_value(current_price)
             last_price = current_price
+
+        self.data['account_value'] = account_values
     
     async def _initialize_grid_orders_once(
         self, 
@@ -302,6 +335,22 @@ class GridTradingStrategy(TradingStrategyInterface):
         else:
             self.logger.info("Plotting is not available for live/paper trading mode.")
     
+    def _precompute_tp_sl_candidates(self, close_prices: np.ndarray) -> np.ndarray:
+        """
+        Flags the candles whose close crosses an enabled TP/SL threshold.
+
+        The runtime conditions (crypto balance, which side triggered) are still
+        evaluated in _handle_take_profit_stop_loss; this mask only lets the
+        backtest loop skip that await on candles that cannot trigger either.
+        """
+        candidates = np.zeros(len(close_prices), dtype=bool)
+
+        if self._take_profit_enabled:
+            candidates |= close_prices >= self._take_profit_threshold
+        if self._stop_loss_enabled:
+            candidates |= close_prices <= self._stop_loss_threshold
+        return candidates
+
     async def _handle_take_profit_stop_loss(self, current_price: float) -> bool:
         """
         Handles take-profit or stop-loss events based on the current price.
@@ -334,7 +383,7 @@ class GridTradingStrategy(TradingStrategyInterface):
         Handles take-profit logic and executes a TP order if conditions are met.
         Returns True if take-profit is triggered.
         """
-        if self.config_manager.is_take_profit_enabled() and current_price >= self.config_manager.get_take_profit_threshold():
+        if self._take_profit_enabled and current_price >= self._take_profit_threshold:
             self.logger.info(f"Take-profit triggered at {current_price}. Executing TP order...")
             await self.order_manager.execute_take_profit_or_stop_loss_order(current_price=current_price, take_profit_order=True)
             return True
@@ -345,7 +394,7 @@ class GridTradingStrategy(TradingStrategyInterface):
         Handles stop-loss logic and executes an SL order if conditions are met.
         Returns True if stop-loss is triggered.
         """
-        if self.config_manager.is_stop_loss_enabled() and current_price <= self.config_manager.get_stop_loss_threshold():
+        if self._stop_loss_enabled and current_price <= self._stop_loss_threshold:
             self.logger.info(f"Stop-loss triggered at {current_price}. Executing SL order...")
             await self.order_manager.execute_take_profit_or_stop_loss_order(current_price=current_price, stop_loss_order=True)
             return True
@@ -79,24 +79,30 @@ class TradingPerformanceAnalyzer:
         return "N/A" if total_sell_revenue == 0 else f"{total_sell_revenue - total_buy_cost:.2f}"
 
     def _calculate_drawdown(self, data: pd.DataFrame) -> float:
-        peak = data['account_value'].expanding(min_periods=1).max()
-        drawdown = (peak - data['account_value']) / peak * 100
-        max_drawdown = drawdown.max()
+        account_values = data['account_value'].to_numpy()
+        # fmax/nanmax ignore NaN like the pandas expanding ops did: candles
+        # after an early take-profit/stop-loss exit are left as NaN by the
+        # backtest loop and must not poison the running peak.
+        peak = np.fmax.accumulate(account_values)
+        drawdown = (peak - account_values) / peak * 100
+        max_drawdown = np.nanmax(drawdown)
         return max_drawdown
 
     def _calculate_runup(self, data: pd.DataFrame) -> float:
-        trough = data['account_value'].expanding(min_periods=1).min()
-        runup = (data['account_value'] - trough) / trough * 100
-        max_runup = runup.max()
+        account_values = data['account_value'].to_numpy()
+        trough = np.fmin.accumulate(account_values)
+        runup = (account_values - trough) / trough * 100
+        max_runup = np.nanmax(runup)
         return max_runup
 
     def _calculate_time_in_profit_loss(
-        self, 
-        initial_balance: float, 
+        self,
+        initial_balance: float,
         data: pd.DataFrame
     ) -> Tuple[float, float]:
-        time_in_profit = (data['account_value'] > initial_balance).mean() * 100
-        time_in_loss = (data['account_value'] <= initial_balance).mean() * 100
+        account_values = data['account_value'].to_numpy()
+        time_in_profit = (account_values > initial_balance).mean() * 100
+        time_in_loss = (account_values <= initial_balance).mean() * 100
         return time_in_profit, time_in_loss
     
     def _calculate_sharpe_ratio(self, data: pd.DataFrame) -> float:
@@ -109,12 +115,15 @@ class TradingPerformanceAnalyzer:
         Returns:
             float: The Sharpe ratio.
         """
-        returns = data['account_value'].pct_change(fill_method=None)
+        account_values = data['account_value'].to_numpy()
+        returns = np.diff(account_values) / account_values[:-1]
         excess_returns = returns - ANNUAL_RISK_FREE_RATE / 252 # Adjusted daily
-        std_dev = excess_returns.std()
+        # The nan-aware reductions skip the NaN tail a truncated backtest
+        # leaves, matching how the pandas mean/std treated missing values.
+        std_dev = np.nanstd(excess_returns, ddof=1)
         if std_dev == 0:
             return 0.0
-        sharpe_ratio = excess_returns.mean() / std_dev * np.sqrt(252)
+        sharpe_ratio = np.nanmean(excess_returns) / std_dev * np.sqrt(252)
         return round(sharpe_ratio, 2)
     
     def _calculate_sortino_ratio(self, data: pd.DataFrame) -> float:
@@ -127,14 +136,17 @@ class TradingPerformanceAnalyzer:
         Returns:
             float: The Sortino ratio.
         """
-        returns = data['account_value'].pct_change(fill_method=None)
+        account_values = data['account_value'].to_numpy()
+        returns = np.diff(account_values) / account_values[:-1]
         excess_returns = returns - ANNUAL_RISK_FREE_RATE / 252  # Adjusted daily
+        # NaN compares False, so the NaN tail of a truncated backtest never
+        # lands in the downside sample; nanmean skips it for the excess mean.
         downside_returns = excess_returns[excess_returns < 0]
-        
-        if len(downside_returns) == 0 or downside_returns.std() == 0:
-            return round(excess_returns.mean() * np.sqrt(252), 2)  # Positive ratio if no downside
-        
-        sortino_ratio = excess_returns.mean() / downside_returns.std() * np.sqrt(252)
+
+        if len(downside_returns) < 2 or downside_returns.std(ddof=1) == 0:
+            return round(np.nanmean(excess_returns) * np.sqrt(252), 2)  # Positive ratio if no downside
+
+        sortino_ratio = np.nanmean(excess_returns) / downside_returns.std(ddof=1) * np.sqrt(252)
         return round(sortino_ratio, 2)
 
     def get_formatted_orders(self) -> List[List[Union[str, float]]]:
@@ -234,7 +246,7 @@ class TradingPerformanceAnalyzer:
         pair = f"{self.base_currency}/{self.quote_currency}"
         start_date = data.index[0]
         end_date = data.index[-1]
-        initial_balance = data["account_value"].iloc[0]
+        initial_balance = data["account_value"].to_numpy()[0]
         duration = end_date - start_date
         final_crypto_value = final_crypto_balance * final_crypto_price
         final_balance = final_fiat_balance + final_crypto_value
@@ -273,10 +285,13 @@ class TradingPerformanceAnalyzer:
 
         formatted_orders = self.get_formatted_orders()
 
-        orders_table = tabulate(formatted_orders, headers=["Order Side", "Type", "Status", "Price", "Quantity", "Timestamp", "Grid Level", "Slippage"], tablefmt="pipe")
-        self.logger.info("\nFormatted Orders:\n" + orders_table)
+        # Rendering the tables is pure presentation work, so skip it entirely
+        # when INFO logging is off (e.g. sweeps running many summaries).
+        if self.logger.isEnabledFor(logging.INFO):
+            orders_table = tabulate(formatted_orders, headers=["Order Side", "Type", "Status", "Price", "Quantity", "Timestamp", "Grid Level", "Slippage"], tablefmt="pipe")
+            self.logger.info("\nFormatted Orders:\n" + orders_table)
 
-        summary_table = tabulate(performance_summary.items(), headers=["Metric", "Value"], tablefmt="grid")
-        self.logger.info("\nPerformance Summary:\n" + summary_table)
+            summary_table = tabulate(performance_summary.items(), headers=["Metric", "Value"], tablefmt="grid")
+            self.logger.info("\nPerformance Summary:\n" + summary_table)
 
         return performance_summary, formatted_orders
\ No newline at end of file
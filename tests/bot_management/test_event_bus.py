@@ -11,7 +11,7 @@ class TestEventBus:
         callback = Mock()
         event_bus.subscribe(Events.ORDER_FILLED, callback)
         assert Events.ORDER_FILLED in event_bus.subscribers
-        assert callback in event_bus.subscribers[Events.ORDER_FILLED]
+        assert (EventBus.SYNC_CALLBACK, callback) in event_bus.subscribers[Events.ORDER_FILLED]
 
     @pytest.mark.asyncio
     async def test_publish_async_single_callback(self, event_bus):
@@ -14,7 +14,7 @@ class TestGridLevel:
         
         assert grid_level.price == 1000
         assert grid_level.state == GridCycleState.READY_TO_BUY
-        assert grid_level.orders == []
+        assert len(grid_level.orders) == 0
         assert grid_level.paired_buy_level is None
         assert grid_level.paired_sell_level is None
 
@@ -223,4 +223,4 @@ class TestGridManager:
         ]
         grids, central_price = grid_manager._calculate_price_grids_and_central_price()
         np.testing.assert_array_almost_equal(grids, expected_grids, decimal=5)
-        assert central_price == 1415.2622462249876
\ No newline at end of file
+        assert central_price == pytest.approx(1415.2622462249876)
\ No newline at end of file
@@ -97,8 +97,7 @@ class TestBalanceTracker:
         assert balance_tracker.total_fees == 10
         assert balance_tracker.reserved_crypto == 1
 
-    @pytest.mark.asyncio
-    async def test_update_balance_on_order_completion(self, setup_balance_tracker):
+    def test_update_balance_on_order_completion(self, setup_balance_tracker):
         balance_tracker, fee_calculator, _ = setup_balance_tracker
         balance_tracker.balance = 1000
         balance_tracker.crypto_balance = 5
@@ -106,14 +105,14 @@ class TestBalanceTracker:
 
         buy_order = Mock(side=OrderSide.BUY, filled=1, price=100)
         balance_tracker.reserved_fiat = 105  # Reserved fiat for the buy order (price + fee)
-        await balance_tracker._update_balance_on_order_completion(buy_order)
+        balance_tracker._update_balance_on_order_completion(buy_order)
         assert balance_tracker.crypto_balance == 6  # Crypto balance increases by 1
         assert balance_tracker.total_fees == 5  # Total fees reflect the buy order fee
         assert balance_tracker.reserved_fiat == 0  # Reserved fiat should be fully consumed
 
         sell_order = Mock(side=OrderSide.SELL, filled=1, price=200)
         balance_tracker.reserved_crypto = 1  # Reserved crypto for the sell order
-        await balance_tracker._update_balance_on_order_completion(sell_order)
+        balance_tracker._update_balance_on_order_completion(sell_order)
         assert balance_tracker.total_fees == 10  # Total fees include the sell order fee
         assert balance_tracker.reserved_crypto == 0  # Reserved crypto should be fully consumed
         assert balance_tracker.balance == 1195  # Remaining balance after the sell order
@@ -126,7 +125,8 @@ class TestBalanceTracker:
 
     def test_event_subscription(self, setup_balance_tracker):
         balance_tracker, _, event_bus = setup_balance_tracker
-        event_bus.subscribe.assert_called_once_with(Events.ORDER_FILLED, balance_tracker._update_balance_on_order_completion)
+        event_bus.subscribe.assert_any_call(Events.ORDER_FILLED, balance_tracker._update_balance_on_order_completion)
+        event_bus.subscribe.assert_any_call(Events.ORDERS_FILLED_BATCH, balance_tracker._update_balances_on_orders_filled_batch)
     
     @pytest.mark.asyncio
     async def test_setup_balances_backtest(self, setup_balance_tracker):
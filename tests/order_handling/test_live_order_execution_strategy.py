@@ -1,4 +1,4 @@
-import pytest
+import pytest, asyncio
 from unittest.mock import AsyncMock, Mock, patch
 from core.order_handling.execution_strategy.live_order_execution_strategy import LiveOrderExecutionStrategy
 from core.order_handling.order import Order, OrderType, OrderSide, OrderStatus
@@ -56,6 +56,40 @@ class TestLiveOrderExecutionStrategy:
 
         assert exchange_service.place_order.call_count == strategy.max_retries
 
+    async def test_execute_market_order_slow_ack_is_not_replaced(self, setup_strategy):
+        strategy, exchange_service = setup_strategy
+        strategy.ack_timeout = 0.01
+        pair = "BTC/USDT"
+        quantity = 0.5
+        price = 30000
+        raw_order = {
+            "id": "slow-ack-order-id",
+            "status": "closed",
+            "type": "market",
+            "side": "buy",
+            "price": price,
+            "amount": quantity,
+            "filled": quantity,
+            "remaining": 0,
+            "symbol": pair,
+            "timestamp": 1680000000000,
+        }
+
+        async def slow_place_order(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return raw_order
+
+        exchange_service.place_order = AsyncMock(side_effect=slow_place_order)
+
+        order = await strategy.execute_market_order(OrderSide.BUY, pair, quantity, price)
+
+        # The acknowledgement arrived after ack_timeout, but the in-flight
+        # placement succeeded, so no second order may be submitted.
+        assert order is not None
+        assert order.identifier == "slow-ack-order-id"
+        assert order.status == OrderStatus.CLOSED
+        exchange_service.place_order.assert_awaited_once()
+
     async def test_execute_limit_order_success(self, setup_strategy):
         strategy, exchange_service = setup_strategy
         pair = "ETH/USDT"
@@ -95,6 +129,82 @@ class TestLiveOrderExecutionStrategy:
         with pytest.raises(OrderExecutionFailedError):
             await strategy.execute_limit_order(OrderSide.SELL, pair, quantity, price)
 
+    async def test_execute_limit_orders_batch_success(self, setup_strategy):
+        strategy, exchange_service = setup_strategy
+        pair = "ETH/USDT"
+        raw_orders = [
+            {
+                "id": f"test-batch-order-{index}",
+                "status": "open",
+                "type": "limit",
+                "side": "buy",
+                "price": price,
+                "amount": 1,
+                "filled": 0,
+                "remaining": 1,
+                "symbol": pair,
+            }
+            for index, price in enumerate([1900, 1950])
+        ]
+
+        exchange_service.place_orders_batch = AsyncMock(return_value=raw_orders)
+
+        orders = await strategy.execute_limit_orders_batch([
+            (OrderSide.BUY, pair, 1, 1900),
+            (OrderSide.BUY, pair, 1, 1950),
+        ])
+
+        exchange_service.place_orders_batch.assert_awaited_once()
+        assert len(orders) == 2
+        assert orders[0].identifier == "test-batch-order-0"
+        assert orders[1].price == 1950
+        assert all(order.order_type == OrderType.LIMIT for order in orders)
+
+    async def test_execute_limit_orders_batch_empty(self, setup_strategy):
+        strategy, exchange_service = setup_strategy
+        exchange_service.place_orders_batch = AsyncMock()
+
+        orders = await strategy.execute_limit_orders_batch([])
+
+        exchange_service.place_orders_batch.assert_not_awaited()
+        assert orders == []
+
+    async def test_warmup_pings_exchange(self, setup_strategy):
+        strategy, exchange_service = setup_strategy
+        exchange_service.get_balance = AsyncMock(return_value={"free": {}})
+
+        await strategy.warmup()
+
+        exchange_service.get_balance.assert_awaited_once()
+
+    async def test_warmup_swallows_exchange_errors(self, setup_strategy):
+        strategy, exchange_service = setup_strategy
+        exchange_service.get_balance = AsyncMock(side_effect=DataFetchError("Exchange API error"))
+
+        await strategy.warmup()  # Should not raise
+
+    async def test_start_and_stop_keepalive(self, setup_strategy):
+        strategy, exchange_service = setup_strategy
+        exchange_service.get_balance = AsyncMock(return_value={"free": {}})
+
+        strategy.start_keepalive()
+        keepalive_task = strategy._keepalive_task
+        assert keepalive_task is not None and not keepalive_task.done()
+
+        strategy.start_keepalive()
+        assert strategy._keepalive_task is keepalive_task  # No duplicate task
+
+        await strategy.stop_keepalive()
+        assert strategy._keepalive_task is None
+        assert keepalive_task.cancelled()
+
+    async def test_execute_limit_orders_batch_data_fetch_error(self, setup_strategy):
+        strategy, exchange_service = setup_strategy
+        exchange_service.place_orders_batch = AsyncMock(side_effect=DataFetchError("Exchange API error"))
+
+        with pytest.raises(OrderExecutionFailedError):
+            await strategy.execute_limit_orders_batch([(OrderSide.BUY, "ETH/USDT", 1, 1900)])
+
     async def test_get_order_success(self, setup_strategy):
         strategy, exchange_service = setup_strategy
         order_id = "test-order-id"
@@ -157,13 +267,13 @@ class TestLiveOrderExecutionStrategy:
     async def test_adjust_price_buy(self, setup_strategy):
         strategy, _ = setup_strategy
         price = 30000
-        adjusted_price = await strategy._adjust_price(OrderSide.BUY, price, 1)
+        adjusted_price = strategy._adjust_price(OrderSide.BUY, price, 1)
 
         assert adjusted_price > price
 
     async def test_adjust_price_sell(self, setup_strategy):
         strategy, _ = setup_strategy
         price = 30000
-        adjusted_price = await strategy._adjust_price(OrderSide.SELL, price, 1)
+        adjusted_price = strategy._adjust_price(OrderSide.SELL, price, 1)
 
         assert adjusted_price < price
\ No newline at end of file
@@ -92,6 +92,37 @@ class TestOrderBook:
         assert len(result) == 1
         assert open_order in result
 
+    def test_get_open_orders_at_price(self, setup_order_book):
+        order_book = setup_order_book
+        open_buy_order = Mock(spec=Order, side=OrderSide.BUY, price=48000, is_open=Mock(return_value=True))
+        open_sell_order = Mock(spec=Order, side=OrderSide.SELL, price=52000, is_open=Mock(return_value=True))
+
+        order_book.add_order(open_buy_order)
+        order_book.add_order(open_sell_order)
+
+        assert order_book.get_open_orders_at_price(OrderSide.BUY, 48000) == [open_buy_order]
+        assert order_book.get_open_orders_at_price(OrderSide.SELL, 52000) == [open_sell_order]
+        assert order_book.get_open_orders_at_price(OrderSide.BUY, 49000) == []
+
+    def test_get_open_orders_at_price_prunes_closed_orders(self, setup_order_book):
+        order_book = setup_order_book
+        order = Mock(spec=Order, side=OrderSide.BUY, price=48000, is_open=Mock(return_value=True))
+
+        order_book.add_order(order)
+        order.is_open.return_value = False
+
+        assert order_book.get_open_orders_at_price(OrderSide.BUY, 48000) == []
+        assert not order_book.has_open_order_prices()
+
+    def test_has_open_order_prices(self, setup_order_book):
+        order_book = setup_order_book
+        assert not order_book.has_open_order_prices()
+
+        open_order = Mock(spec=Order, side=OrderSide.BUY, price=48000, is_open=Mock(return_value=True))
+        order_book.add_order(open_order)
+
+        assert order_book.has_open_order_prices()
+
     def test_get_completed_orders(self, setup_order_book):
         order_book = setup_order_book
         completed_order = Mock(spec=Order, side=OrderSide.BUY, is_filled=Mock(return_value=True))
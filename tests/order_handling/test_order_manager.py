@@ -1,4 +1,5 @@
 import pytest, asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 from config.trading_mode import TradingMode
 from core.order_handling.order_manager import OrderManager
@@ -38,7 +39,7 @@ class TestOrderManager:
     @pytest.mark.asyncio
     async def test_initialize_grid_orders_buy_orders(self, setup_order_manager):
         manager, grid_manager, order_validator, balance_tracker, _, _, order_execution_strategy, _ = setup_order_manager
-        grid_manager.sorted_buy_grids = [50000, 49000, 48000]
+        grid_manager.sorted_buy_grids = [48000, 49000, 50000]
         grid_manager.sorted_sell_grids = []
         grid_manager.grid_levels = {50000: Mock(), 49000: Mock(), 48000: Mock()}
         grid_manager.can_place_order.side_effect = lambda level, side: side == OrderSide.BUY
@@ -214,7 +215,9 @@ class TestOrderManager:
     @pytest.mark.asyncio
     async def test_simulate_order_fills_partial_fill(self, setup_order_manager):
         manager, grid_manager, _, _, order_book, _, _, _ = setup_order_manager
-        mock_order = Mock(
+        # A plain attribute carrier is enough here: the fill path only reads
+        # and writes order fields, so no call recording is needed.
+        mock_order = SimpleNamespace(
             side=OrderSide.BUY,
             price=48000,
             amount=0.02,
@@ -222,7 +225,8 @@ class TestOrderManager:
             remaining=0.01,
             status=OrderStatus.OPEN
         )
-        order_book.get_open_orders.return_value = [mock_order]
+        order_book.has_open_order_prices.return_value = True
+        order_book.get_open_orders_at_price.side_effect = lambda side, price: [mock_order] if side == OrderSide.BUY and price == 48000 else []
         grid_manager.sorted_buy_grids = [48000]
         grid_manager.sorted_sell_grids = []
 
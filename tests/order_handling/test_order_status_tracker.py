@@ -108,6 +108,65 @@ class TestOrderStatusTracker:
 
             mock_logger_warning.assert_called_once_with("Unhandled order status 'unexpected_status' for order order_1.")
 
+    @pytest.mark.asyncio
+    async def test_start_tracking_uses_order_stream_when_available(self, setup_tracker):
+        tracker, _, order_execution_strategy, _ = setup_tracker
+        exchange_service = Mock()
+        exchange_service.listen_to_order_updates = AsyncMock()
+        tracker.exchange_service = exchange_service
+        tracker.trading_pair = "BTC/USDT"
+
+        tracker.start_tracking()
+        await asyncio.sleep(0)
+
+        exchange_service.listen_to_order_updates.assert_awaited_once_with("BTC/USDT", tracker._on_order_update)
+        await tracker.stop_tracking()
+
+    @pytest.mark.asyncio
+    async def test_start_tracking_polls_when_venue_lacks_order_stream(self, setup_tracker):
+        tracker, order_book, _, _ = setup_tracker
+        exchange_service = Mock()
+        exchange_service.listen_to_order_updates = AsyncMock()
+        exchange_service.supports_order_updates = Mock(return_value=False)
+        tracker.exchange_service = exchange_service
+        tracker.trading_pair = "BTC/USDT"
+        order_book.get_open_orders.return_value = []
+
+        tracker.start_tracking()
+        await asyncio.sleep(0)
+
+        exchange_service.listen_to_order_updates.assert_not_awaited()
+        await tracker.stop_tracking()
+
+    @pytest.mark.asyncio
+    async def test_stream_tracking_falls_back_to_polling_when_stream_ends(self, setup_tracker):
+        tracker, order_book, _, _ = setup_tracker
+        exchange_service = Mock()
+        # The stream gives up without being cancelled (e.g. retries exhausted).
+        exchange_service.listen_to_order_updates = AsyncMock()
+        tracker.exchange_service = exchange_service
+        tracker.trading_pair = "BTC/USDT"
+        order_book.get_open_orders.return_value = []
+
+        tracker.start_tracking()
+        await asyncio.sleep(0.01)
+
+        order_book.get_open_orders.assert_called()
+        await tracker.stop_tracking()
+
+    @pytest.mark.asyncio
+    async def test_on_order_update_parses_and_handles_status_change(self, setup_tracker):
+        tracker, _, order_execution_strategy, _ = setup_tracker
+        raw_order = {"id": "order_1", "status": "closed"}
+        mock_remote_order = Mock(identifier="order_1", status=OrderStatus.CLOSED)
+        order_execution_strategy._parse_order_result = Mock(return_value=mock_remote_order)
+        tracker._handle_order_status_change = Mock()
+
+        await tracker._on_order_update(raw_order)
+
+        order_execution_strategy._parse_order_result.assert_called_once_with(raw_order)
+        tracker._handle_order_status_change.assert_called_once_with(mock_remote_order)
+
     @pytest.mark.asyncio
     async def test_start_tracking_creates_monitoring_task(self, setup_tracker):
         tracker, _, _, _ = setup_tracker
@@ -94,6 +94,29 @@ class TestLiveExchangeService:
 
         mock_exchange_instance.create_order.assert_called_once_with("BTC/USD",  "limit", "buy", 1, 50000.0)
 
+    @patch("core.services.live_exchange_service.ccxt")
+    @patch("core.services.live_exchange_service.getattr")
+    @pytest.mark.asyncio
+    async def test_place_orders_batch_partial_failure_cancels_placed_orders(self, mock_getattr, mock_ccxt, config_manager, setup_env_vars, mock_exchange_instance):
+        mock_getattr.return_value = mock_ccxt.binance
+        mock_ccxt.binance.return_value = mock_exchange_instance
+        mock_exchange_instance.has = {"createOrders": False}
+        mock_exchange_instance.create_order = AsyncMock(side_effect=[
+            {"id": "order-1", "status": "open"},
+            ccxt.NetworkError("Network error"),
+        ])
+        mock_exchange_instance.cancel_order = AsyncMock(return_value={"status": "canceled"})
+        service = LiveExchangeService(config_manager, is_paper_trading_activated=False)
+
+        with pytest.raises(DataFetchError, match="1 of 2 batch orders failed"):
+            await service.place_orders_batch([
+                {"symbol": "BTC/USD", "type": "limit", "side": "buy", "amount": 1, "price": 49000.0},
+                {"symbol": "BTC/USD", "type": "limit", "side": "buy", "amount": 1, "price": 48000.0},
+            ])
+
+        # The order that did land must be unwound so nothing rests untracked.
+        mock_exchange_instance.cancel_order.assert_awaited_once_with("order-1", "BTC/USD")
+
     @patch("core.services.live_exchange_service.ccxt")
     @patch("core.services.live_exchange_service.getattr")
     @pytest.mark.asyncio
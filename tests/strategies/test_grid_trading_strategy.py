@@ -91,7 +91,9 @@ class TestGridTradingStrategy:
 
     @pytest.mark.asyncio
     async def test_run_backtest(self, setup_strategy):
-        create_strategy, _, _, grid_manager, order_manager, balance_tracker, *_ = setup_strategy
+        create_strategy, config_manager, _, grid_manager, order_manager, balance_tracker, *_ = setup_strategy
+        # Make the last candle a TP candidate so the TP/SL path is exercised.
+        config_manager.get_take_profit_threshold.return_value = 11000
         strategy = create_strategy()
 
         strategy.data = pd.DataFrame(
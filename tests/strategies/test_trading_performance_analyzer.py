@@ -41,6 +41,19 @@ class TestPerformanceAnalyzer:
         max_drawdown = analyzer._calculate_drawdown(mock_account_data)
         assert max_drawdown == approx(9.52, rel=1e-3)
 
+    def test_metrics_ignore_nan_tail_after_early_exit(self, setup_performance_analyzer):
+        analyzer, _, _ = setup_performance_analyzer
+        # A take-profit/stop-loss exit breaks out of the backtest loop early,
+        # leaving the remaining account_value slots as NaN.
+        data = pd.DataFrame({
+            "account_value": [100.0, 110.0, 105.0, float("nan"), float("nan")]
+        }, index=pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04', '2024-01-05']))
+
+        assert analyzer._calculate_drawdown(data) == approx(4.545, rel=1e-3)
+        assert analyzer._calculate_runup(data) == approx(10.0)
+        assert not pd.isna(analyzer._calculate_sharpe_ratio(data))
+        assert not pd.isna(analyzer._calculate_sortino_ratio(data))
+
     def test_calculate_runup(self, setup_performance_analyzer, mock_account_data):
         analyzer, _, _ = setup_performance_analyzer
         max_runup = analyzer._calculate_runup(mock_account_data)
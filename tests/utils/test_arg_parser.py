@@ -35,6 +35,21 @@ def test_parse_and_validate_console_args_profile():
         result = parse_and_validate_console_args()
         assert result.profile is True
 
+def test_parse_and_validate_console_args_max_concurrent():
+    with patch.object(sys, 'argv', ["program_name", "--config", "config.json", "--max-concurrent", "3"]):
+        result = parse_and_validate_console_args()
+        assert result.max_concurrent == 3
+
+def test_parse_and_validate_console_args_max_concurrent_default():
+    with patch.object(sys, 'argv', ["program_name", "--config", "config.json"]):
+        result = parse_and_validate_console_args()
+        assert result.max_concurrent == 0
+
+def test_parse_and_validate_console_args_max_concurrent_negative():
+    with patch.object(sys, 'argv', ["program_name", "--config", "config.json", "--max-concurrent", "-1"]), \
+        pytest.raises(RuntimeError, match="Argument validation failed."):
+        parse_and_validate_console_args()
+
 @patch("utils.arg_parser.logging.error")
 def test_parse_and_validate_console_args_argument_error(mock_log):
     with patch.object(sys, 'argv', ["program_name", "--config"]), \
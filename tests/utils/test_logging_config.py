@@ -1,7 +1,9 @@
 import os, logging
+from logging.handlers import QueueHandler
 from unittest.mock import patch, MagicMock
 import pytest
 from logging.handlers import RotatingFileHandler
+import utils.logging_config as logging_config
 from utils.logging_config import setup_logging
 
 @pytest.fixture
@@ -20,13 +22,21 @@ def mock_rotating_file_handler():
         mocked_handler.return_value = MagicMock()
         yield mocked_handler
 
+@pytest.fixture(autouse=True)
+def stop_queue_listener():
+    yield
+    logging_config._stop_queue_listener()
+
 def test_setup_logging_console_only(mock_basicConfig):
     setup_logging(log_level=logging.INFO, log_to_file=False)
 
     mock_basicConfig.assert_called_once()
     handlers = mock_basicConfig.call_args[1]["handlers"]
     assert len(handlers) == 1
-    assert isinstance(handlers[0], logging.StreamHandler)
+    assert isinstance(handlers[0], QueueHandler)
+    listener_handlers = logging_config._queue_listener.handlers
+    assert len(listener_handlers) == 1
+    assert isinstance(listener_handlers[0], logging.StreamHandler)
 
 @patch("os.makedirs")
 @patch("logging.basicConfig")
@@ -42,10 +52,10 @@ def test_setup_logging_file_logging(mock_rotating_file_handler, mock_basic_confi
 
     mock_makedirs.assert_called_once_with("logs", exist_ok=True)
     mock_basic_config.assert_called_once()
-    handlers = mock_basic_config.call_args[1]["handlers"]
+    listener_handlers = logging_config._queue_listener.handlers
 
-    assert len(handlers) == 2
-    assert any(isinstance(handler, logging.StreamHandler) for handler in handlers)
+    assert len(listener_handlers) == 2
+    assert any(isinstance(handler, logging.StreamHandler) for handler in listener_handlers)
 
 @patch("os.makedirs")
 @patch("logging.basicConfig")
@@ -55,10 +65,10 @@ def test_setup_logging_default_file_logging(mock_rotating_file_handler, mock_bas
 
     mock_makedirs.assert_called_once_with("logs", exist_ok=True)
     mock_basic_config.assert_called_once()
-    handlers = mock_basic_config.call_args[1]["handlers"]
-    
-    assert len(handlers) == 2 
-    assert any(isinstance(handler, logging.StreamHandler) for handler in handlers)
+    listener_handlers = logging_config._queue_listener.handlers
+
+    assert len(listener_handlers) == 2
+    assert any(isinstance(handler, logging.StreamHandler) for handler in listener_handlers)
 
 def test_setup_logging_logs_info(mock_basicConfig, mock_rotating_file_handler, caplog):
     with caplog.at_level(logging.INFO):
@@ -71,4 +81,4 @@ def test_setup_logging_directory_creation_error(mock_makedirs):
     mock_makedirs.side_effect = OSError("Directory creation failed")
 
     with pytest.raises(OSError, match="Directory creation failed"):
-        setup_logging(log_level=logging.DEBUG, log_to_file=True)
\ No newline at end of file
+        setup_logging(log_level=logging.DEBUG, log_to_file=True)
@@ -14,6 +14,9 @@ def validate_args(args):
         if save_performance_dir and not os.path.exists(save_performance_dir):
             raise ValueError(f"The directory for saving performance results does not exist: {save_performance_dir}")
 
+    if args.max_concurrent < 0:
+        raise ValueError(f"--max-concurrent must be 0 (unlimited) or a positive number, got: {args.max_concurrent}")
+
 def parse_and_validate_console_args(cli_args=None):
     """
     Parses and validates console arguments.
@@ -31,6 +34,7 @@ def parse_and_validate_console_args(cli_args=None):
         parser.add_argument('--save_performance_results', type=str, metavar='FILE', help='Path to save simulation results (e.g., results.json)')
         parser.add_argument('--no-plot', action='store_true', help='Disable the display of plots at the end of the simulation')
         parser.add_argument('--profile', action='store_true', help='Enable profiling')
+        parser.add_argument('--max-concurrent', type=int, default=0, metavar='N', help='Maximum number of configs run concurrently (0 = unlimited)')
         args = parser.parse_args(cli_args)
         validate_args(args)
         return args
@@ -1,7 +1,19 @@
-import logging, os
-from logging.handlers import RotatingFileHandler
+import logging, os, atexit, queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from typing import Optional
 
+# The listener thread that drains the log queue into the real handlers.
+# Replaced (and the old one stopped) each time setup_logging reconfigures.
+_queue_listener: Optional[QueueListener] = None
+
+def _stop_queue_listener() -> None:
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
 def setup_logging(
     log_level: int,
     log_to_file: bool = False,
@@ -12,6 +24,10 @@ def setup_logging(
     """
     Sets up logging with options for console, rotating file logging, and log differentiation.
 
+    Log records are routed through a QueueHandler to a QueueListener running
+    on its own thread, so stream and file I/O never block the asyncio event
+    loop: a log call on the hot path only enqueues the record.
+
     Args:
         log_level (int): The logging level (e.g., logging.INFO, logging.DEBUG).
         log_to_file (bool): Whether to log to a file.
@@ -19,28 +35,56 @@ def setup_logging(
         max_file_size (int): Maximum size of log file in bytes before rotation.
         backup_count (int): Number of backup log files to keep.
     """
+    global _queue_listener
+
+    # The log format uses none of the thread/process/caller fields, so skip
+    # collecting them: each one costs a get_ident/getpid or, for the caller
+    # info, a stack walk on every record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
     handlers = []
 
+    # One formatter instance serves every handler; building a second one per
+    # handler just re-parses the same format string.
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    console_handler.setFormatter(formatter)
     handlers.append(console_handler)
     log_file_path = ""
 
     if log_to_file:
         log_dir = 'logs'
         os.makedirs(log_dir, exist_ok=True)
-        
+
         if config_name:
             log_file_path = os.path.join(log_dir, f"{config_name}.log")
         else:
             log_file_path = os.path.join(log_dir, 'grid_trading_bot.log')
 
-        file_handler = RotatingFileHandler(log_file_path, maxBytes=max_file_size, backupCount=backup_count)
-        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        # delay=True defers opening the file until the first record, so bots
+        # that never log to file (or exit before logging) skip the open().
+        file_handler = RotatingFileHandler(log_file_path, maxBytes=max_file_size, backupCount=backup_count, delay=True)
+        file_handler.setFormatter(formatter)
         handlers.append(file_handler)
 
-    logging.basicConfig(level=log_level, handlers=handlers)
+    # Drain any previous listener before rewiring so no records are stranded
+    # in its queue when the handlers are swapped out.
+    _stop_queue_listener()
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    # force=True makes reconfiguration explicit: without it basicConfig is a
+    # silent no-op once the root logger has handlers, so running several
+    # configs in one process would keep logging through the first config's
+    # handlers while the new ones leak unattached.
+    logging.basicConfig(level=log_level, handlers=[QueueHandler(log_queue)], force=True)
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
     logging.info(f"Logging initialized. Log level: {logging.getLevelName(log_level)}")
 
     if log_to_file:
-        logging.info(f"File logging enabled. Logs are stored in: {log_file_path}")
\ No newline at end of file
+        logging.info(f"File logging enabled. Logs are stored in: {log_file_path}")